@@ -22,8 +22,9 @@
 
 #include <juce_core/juce_core.h>
 #include <juce_audio_formats/juce_audio_formats.h>
-#include <openssl/sha.h>
+#include <openssl/evp.h>
 #include <queue>
+#include <vector>
 #include <atomic>
 #include <condition_variable>
 #include <set>
@@ -87,16 +88,20 @@ private:
             return "";
         }
 
-        unsigned char hash[SHA256_DIGEST_LENGTH];
-        SHA256_CTX sha256;
-        SHA256_Init(&sha256);
+        // EVP dispatches to OpenSSL's hardware SHA-256 (SHA-NI / ARMv8 crypto) when available
+        std::unique_ptr<EVP_MD_CTX, decltype(&EVP_MD_CTX_free)> ctx(EVP_MD_CTX_new(), &EVP_MD_CTX_free);
+        if (!ctx || EVP_DigestInit_ex(ctx.get(), EVP_sha256(), nullptr) != 1) {
+            std::cerr << "[gRPC] Failed to initialize SHA256 digest" << std::endl;
+            return "";
+        }
 
-        char buffer[8192];
-        while (file.read(buffer, sizeof(buffer))) {
-            SHA256_Update(&sha256, buffer, file.gcount());
+        // 1 MiB reads keep per-call overhead low while the chunk stays cache-resident
+        std::vector<char> buffer(1 << 20);
+        while (file.read(buffer.data(), static_cast<std::streamsize>(buffer.size()))) {
+            EVP_DigestUpdate(ctx.get(), buffer.data(), static_cast<size_t>(file.gcount()));
         }
         if (file.gcount() > 0) {
-            SHA256_Update(&sha256, buffer, file.gcount());
+            EVP_DigestUpdate(ctx.get(), buffer.data(), static_cast<size_t>(file.gcount()));
         }
 
         if (file.bad()) {
@@ -104,10 +109,15 @@ private:
             return "";
         }
 
-        SHA256_Final(hash, &sha256);
+        unsigned char hash[EVP_MAX_MD_SIZE];
+        unsigned int hashLength = 0;
+        if (EVP_DigestFinal_ex(ctx.get(), hash, &hashLength) != 1) {
+            std::cerr << "[gRPC] Failed to finalize SHA256 digest" << std::endl;
+            return "";
+        }
 
         std::stringstream ss;
-        for (int i = 0; i < SHA256_DIGEST_LENGTH; ++i) {
+        for (unsigned int i = 0; i < hashLength; ++i) {
             ss << std::hex << std::setw(2) << std::setfill('0') << static_cast<int>(hash[i]);
         }
         return ss.str();
@@ -632,7 +642,7 @@ public:
     }
 };
 
-void RunServer(int port = 50051) {
+void RunServer(int port = 50051, grpc_compression_algorithm compression = GRPC_COMPRESS_NONE) {
     std::string server_address = "0.0.0.0:" + std::to_string(port);
     AudioEngineServiceImpl service;
 
@@ -643,6 +653,17 @@ void RunServer(int port = 50051) {
     builder.AddListeningPort(server_address, grpc::InsecureServerCredentials());
     builder.RegisterService(&service);
 
+    // Let clients hold one long-lived, keepalive-pinged channel across idle periods
+    // instead of reconnecting (default policy answers frequent pings with GOAWAY)
+    builder.AddChannelArgument(GRPC_ARG_KEEPALIVE_PERMIT_WITHOUT_CALLS, 1);
+    builder.AddChannelArgument(GRPC_ARG_HTTP2_MIN_RECV_PING_INTERVAL_WITHOUT_DATA_MS, 10000);
+    builder.AddChannelArgument(GRPC_ARG_HTTP2_MAX_PING_STRIKES, 0);
+
+    // Compress responses (event streams included) for clients that accept the algorithm
+    if (compression != GRPC_COMPRESS_NONE) {
+        builder.SetDefaultCompressionAlgorithm(compression);
+    }
+
     std::unique_ptr<Server> server(builder.BuildAndStart());
     if (!server) {
         std::cerr << "[gRPC] Failed to start server on " << server_address << std::endl;
@@ -660,12 +681,14 @@ void printUsage(const char* programName) {
     std::cout << std::endl;
     std::cout << "Options:" << std::endl;
     std::cout << "  --port <port>       Server port (default: 50051)" << std::endl;
+    std::cout << "  --compression <alg> Response compression: none, gzip, deflate (default: none)" << std::endl;
     std::cout << "  --help, -h          Show this help message" << std::endl;
     std::cout << std::endl;
 }
 
 int main(int argc, char** argv) {
     int port = 50051;
+    grpc_compression_algorithm compression = GRPC_COMPRESS_NONE;
 
     // Parse command line arguments
     for (int i = 1; i < argc; ++i) {
@@ -681,6 +704,18 @@ int main(int argc, char** argv) {
                 std::cerr << "Error: invalid port argument: " << argv[i] << std::endl;
                 return 1;
             }
+        } else if (arg == "--compression" && i + 1 < argc) {
+            std::string alg = argv[++i];
+            if (alg == "none") {
+                compression = GRPC_COMPRESS_NONE;
+            } else if (alg == "gzip") {
+                compression = GRPC_COMPRESS_GZIP;
+            } else if (alg == "deflate") {
+                compression = GRPC_COMPRESS_DEFLATE;
+            } else {
+                std::cerr << "Error: invalid compression algorithm: " << alg << std::endl;
+                return 1;
+            }
         } else if (arg == "--help" || arg == "-h") {
             printUsage(argv[0]);
             return 0;
@@ -694,7 +729,7 @@ int main(int argc, char** argv) {
     // Initialize JUCE
 
     try {
-        RunServer(port);
+        RunServer(port, compression);
     } catch (const std::exception& e) {
         std::cerr << "[gRPC] Server error: " << e.what() << std::endl;
         return 1;
@@ -6,24 +6,45 @@ Watches a Google Doc for EDL changes and communicates with the audio engine via
 """
 
 import argparse
-import json
+import functools
+import itertools
+import signal
+import string
+import tempfile
 import threading
 import time
-import uuid
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from pathlib import Path
-from queue import Queue
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
 
-from flask import Flask, request, jsonify, current_app, Response
+import orjson
+from cachetools import TTLCache
 
 from edl_io import parse_and_convert, edl_cache, seconds_to_samples
 from gdocs import GoogleDocsClient
 from grpc_client import AudioEngineClient
+from push_watcher import PushWatcher
+from worker_pool import WorkerPool
+
+# Job registry bounds: finished jobs stay queryable via /job/<id> for JOB_TTL_SEC
+MAX_JOBS = 4096
+JOB_TTL_SEC = 3600
+
+# Errors reported within this window are written to the doc in one batch
+ERROR_DEBOUNCE_SEC = 0.5
+
+# Render events are buffered in memory up to this size, then spill to disk
+EVENTS_SPOOL_MAX_BYTES = 1 << 20
 
 
 class RenderJob:
     """Represents a background render job."""
 
+    # Created per /render request; slots keep allocation cheap and the footprint small
+    __slots__ = ('job_id', 'edl_id', 'start', 'dur', 'out_path', 'bit_depth', 'status', 'error', 'result')
+
     def __init__(self, job_id: str, edl_id: str, start: float, dur: float, out_path: str, bit_depth: int):
         self.job_id = job_id
         self.edl_id = edl_id
@@ -47,6 +68,8 @@ class DocsBridge:
         credentials_path: Optional[str] = None,
         oauth_client_path: Optional[str] = None,
         token_path: Optional[str] = None,
+        pubsub_subscription: Optional[str] = None,
+        workers: int = 1,
         verbose: bool = False
     ):
         """
@@ -59,6 +82,10 @@ class DocsBridge:
             credentials_path: Path to OAuth credentials or service account key
             oauth_client_path: Path to OAuth client JSON
             token_path: Path to OAuth token file
+            pubsub_subscription: Pub/Sub subscription for doc change notifications
+                                 (replaces polling when set)
+            workers: Number of render worker threads (default: 1; the engine renders
+                     through one shared EdlRenderer, so more than 1 runs renders concurrently)
             verbose: Enable verbose logging
         """
         self.doc_id = doc_id
@@ -66,6 +93,7 @@ class DocsBridge:
         self.poll_interval = poll_interval
         self.oauth_client_path = oauth_client_path
         self.token_path = token_path
+        self.pubsub_subscription = pubsub_subscription
         self.verbose = verbose
 
         self.gdocs_client = GoogleDocsClient(
@@ -77,12 +105,19 @@ class DocsBridge:
         self.last_revision_id = None
         self.last_edl_id = None
 
-        self.running = False
+        # Set on shutdown; also serves as the poll loop's interruptible sleep
+        self._stop_event = threading.Event()
         self.poll_thread = None
-        self.worker_thread = None
+        self.push_watcher = None
 
-        self.render_queue = Queue()
-        self.jobs: Dict[str, RenderJob] = {}
+        self.worker_pool = WorkerPool(self._process_render_job, workers)
+        self.jobs: TTLCache = TTLCache(maxsize=MAX_JOBS, ttl=JOB_TTL_SEC)
+        self._jobs_lock = threading.Lock()
+        self._job_counter = itertools.count(1)
+
+        self._error_lock = threading.Lock()
+        self._pending_errors: List[str] = []
+        self._error_timer: Optional[threading.Timer] = None
 
     def start(self):
         """Start the bridge service."""
@@ -119,14 +154,35 @@ class DocsBridge:
             print("Starting Bridge Services")
             print("="*60)
             print(f"[bridge] Document ID: {self.doc_id}")
-            print(f"[bridge] Poll interval: {self.poll_interval}s")
+            if self.pubsub_subscription:
+                print(f"[bridge] Pub/Sub subscription: {self.pubsub_subscription}")
+            else:
+                print(f"[bridge] Poll interval: {self.poll_interval}s")
+            print(f"[bridge] Render workers: {self.worker_pool.num_workers}")
 
-        self.running = True
-        self.poll_thread = threading.Thread(target=self._poll_loop, daemon=True)
-        self.poll_thread.start()
+        self._stop_event.clear()
 
-        self.worker_thread = threading.Thread(target=self._worker_loop, daemon=True)
-        self.worker_thread.start()
+        if self.pubsub_subscription:
+            # Sync the current revision once, then only wake on notifications
+            try:
+                self._check_doc_update()
+            except Exception as e:
+                print(f"Error in initial doc check: {e}")
+
+            self.push_watcher = PushWatcher(
+                self.pubsub_subscription,
+                self.doc_id,
+                verbose=self.verbose
+            )
+            if not self.push_watcher.start(self._check_doc_update):
+                print("\n❌ Failed to start Pub/Sub watcher")
+                self._stop_event.set()
+                return False
+        else:
+            self.poll_thread = threading.Thread(target=self._poll_loop, daemon=True)
+            self.poll_thread.start()
+
+        self.worker_pool.start()
 
         if self.verbose:
             print("[bridge] All services started")
@@ -139,13 +195,22 @@ class DocsBridge:
     def stop(self):
         """Stop the bridge service."""
         print("Stopping bridge...")
-        self.running = False
+        self._stop_event.set()
+
+        if self.push_watcher:
+            self.push_watcher.stop()
 
         if self.poll_thread:
             self.poll_thread.join(timeout=5)
 
-        if self.worker_thread:
-            self.worker_thread.join(timeout=5)
+        self.worker_pool.stop()
+
+        # Write out any debounced errors before shutting down
+        with self._error_lock:
+            error_timer = self._error_timer
+        if error_timer:
+            error_timer.cancel()
+        self._flush_errors()
 
         if self.grpc_client:
             self.grpc_client.close()
@@ -154,17 +219,27 @@ class DocsBridge:
 
     def _poll_loop(self):
         """Polling loop that watches for doc changes."""
-        while self.running:
+        while not self._stop_event.is_set():
             try:
                 self._check_doc_update()
             except Exception as e:
                 print(f"Error in poll loop: {e}")
 
-            time.sleep(self.poll_interval)
+            self._stop_event.wait(self.poll_interval)
 
     def _check_doc_update(self):
         """Check if doc has changed and process if needed."""
-        content, revision_id, error = self.gdocs_client.get_doc_content(self.doc_id)
+        # Cheap head check first; only fetch the body when the revision moved
+        head_revision_id, error = self.gdocs_client.get_head_revision_id(self.doc_id)
+
+        if error:
+            print(f"Failed to fetch doc revision: {error}")
+            return
+
+        if head_revision_id == self.last_revision_id:
+            return
+
+        content, revision_id, error = self.gdocs_client.get_doc_content(self.doc_id, head_revision_id)
 
         if error:
             print(f"Failed to fetch doc: {error}")
@@ -177,6 +252,9 @@ class DocsBridge:
         print(f"Doc revision changed: {revision_id}")
         self.last_revision_id = revision_id
 
+        # The doc may have been edited by someone else; re-read its end on next append
+        self.gdocs_client.invalidate_end_index(self.doc_id)
+
         # Parse and convert EDL
         edl_proto, parse_error = parse_and_convert(content, self.doc_id)
 
@@ -197,6 +275,7 @@ class DocsBridge:
 
         print(f"UpdateEdl success: {result}")
         self.last_edl_id = result['edl_id']
+        self.cancel_stale_jobs(result['edl_id'])
 
         # Append success feedback
         feedback = (
@@ -206,11 +285,27 @@ class DocsBridge:
         self.gdocs_client.append_paragraph(self.doc_id, feedback)
 
     def _append_error(self, operation: str, error_msg: str):
-        """Append error message to doc."""
-        try:
-            self.gdocs_client.append_paragraph(self.doc_id, f"❌ {operation}: {error_msg}")
-        except Exception as e:
-            print(f"Failed to append error to doc: {e}")
+        """Queue error message for the doc; bursts are flushed in one batch."""
+        with self._error_lock:
+            self._pending_errors.append(f"❌ {operation}: {error_msg}")
+            if self._error_timer is None:
+                self._error_timer = threading.Timer(ERROR_DEBOUNCE_SEC, self._flush_errors)
+                self._error_timer.daemon = True
+                self._error_timer.start()
+
+    def _flush_errors(self):
+        """Append all queued error messages to doc."""
+        with self._error_lock:
+            messages = self._pending_errors
+            self._pending_errors = []
+            self._error_timer = None
+
+        if not messages:
+            return
+
+        error = self.gdocs_client.append_many(self.doc_id, messages)
+        if error:
+            print(f"Failed to append error to doc: {error}")
 
     def enqueue_render(
         self,
@@ -233,18 +328,50 @@ class DocsBridge:
         Returns:
             Job ID
         """
-        job_id = str(uuid.uuid4())
+        # Process-unique IDs: a hex counter is shorter than a UUID and needs no entropy
+        job_key = next(self._job_counter)
+        job_id = format(job_key, 'x')
         job = RenderJob(job_id, edl_id, start, dur, out_path, bit_depth)
 
-        self.jobs[job_id] = job
-        self.render_queue.put(job)
+        with self._jobs_lock:
+            self.jobs[job_key] = job
+        self.worker_pool.submit(job)
 
         print(f"Enqueued render job: {job_id}")
         return job_id
 
+    def cancel_stale_jobs(self, new_edl_id: str) -> int:
+        """
+        Cancel queued render jobs for any EDL other than `new_edl_id`.
+
+        Args:
+            new_edl_id: EDL identifier that just became current
+
+        Returns:
+            Number of jobs cancelled
+        """
+        cancelled = self.worker_pool.remove_if(lambda job: job.edl_id != new_edl_id)
+
+        for job in cancelled:
+            self._set_job_status(job, 'cancelled')
+
+        if cancelled:
+            print(f"Cancelled {len(cancelled)} stale render job(s)")
+
+        return len(cancelled)
+
     def get_job_status(self, job_id: str) -> Optional[Dict]:
         """Get status of a render job."""
-        job = self.jobs.get(job_id)
+        try:
+            job_key = int(job_id, 16)
+        except ValueError:
+            return None
+        # int() also takes "0x1", "01", "1_0" and surrounding spaces; only the id as issued is valid
+        if format(job_key, 'x') != job_id:
+            return None
+
+        with self._jobs_lock:
+            job = self.jobs.get(job_key)
         if not job:
             return None
 
@@ -255,20 +382,19 @@ class DocsBridge:
             'result': job.result,
         }
 
-    def _worker_loop(self):
-        """Worker loop that processes render jobs."""
-        while self.running:
-            try:
-                job = self.render_queue.get(timeout=1)
-                self._process_render_job(job)
-            except Exception:
-                # Queue.get timeout or other error
-                continue
+    def _set_job_status(self, job: RenderJob, status: str):
+        """Update job status and refresh its registry entry TTL."""
+        job.status = status
+        with self._jobs_lock:
+            self.jobs[int(job.job_id, 16)] = job
 
     def _process_render_job(self, job: RenderJob):
         """Process a single render job."""
+        if job.status == 'cancelled':
+            return
+
         print(f"Processing render job: {job.job_id}")
-        job.status = 'running'
+        self._set_job_status(job, 'running')
 
         try:
             # Get sample rate for EDL
@@ -278,58 +404,101 @@ class DocsBridge:
             start_samples = seconds_to_samples(job.start, sample_rate)
             duration_samples = seconds_to_samples(job.dur, sample_rate)
 
-            # Collect events
-            events = []
-
-            for event, error in self.grpc_client.render_edl_window(
-                job.edl_id,
-                start_samples,
-                duration_samples,
-                job.out_path,
-                job.bit_depth
-            ):
-                if error:
-                    job.status = 'failed'
-                    job.error = error
-                    print(f"Render job {job.job_id} failed: {error}")
-                    self._append_error("RenderEdlWindow", error)
-                    return
-
-                events.append(event)
-
-                # Handle complete event
-                if event['type'] == 'complete':
-                    job.status = 'completed'
-                    job.result = event
-                    print(f"Render job {job.job_id} completed")
-
-                    # Append success feedback
-                    feedback = (
-                        f"✅ Render complete: "
-                        f"SHA256={event['sha256']}, "
-                        f"output={event['out_path']}"
-                    )
-                    self.gdocs_client.append_paragraph(self.doc_id, feedback)
-
-                    # Append events as code block
-                    events_json = '\n'.join(json.dumps(e) for e in events)
-                    self.gdocs_client.append_code_block(self.doc_id, 'engineevents', events_json)
-                    return
+            # Collect events as JSON lines
+            with tempfile.SpooledTemporaryFile(max_size=EVENTS_SPOOL_MAX_BYTES, mode='w+b') as events:
+                for event, error in self.grpc_client.render_edl_window(
+                    job.edl_id,
+                    start_samples,
+                    duration_samples,
+                    job.out_path,
+                    job.bit_depth
+                ):
+                    if error:
+                        job.error = error
+                        self._set_job_status(job, 'failed')
+                        print(f"Render job {job.job_id} failed: {error}")
+                        self._append_error("RenderEdlWindow", error)
+                        return
+
+                    events.write(orjson.dumps(event))
+                    events.write(b'\n')
+
+                    # Handle complete event
+                    if event['type'] == 'complete':
+                        job.result = event
+                        self._set_job_status(job, 'completed')
+                        print(f"Render job {job.job_id} completed")
+
+                        # Append success feedback and events code block in one batch
+                        feedback = (
+                            f"✅ Render complete: "
+                            f"SHA256={event['sha256']}, "
+                            f"output={event['out_path']}"
+                        )
+                        events.seek(0)
+                        events_json = events.read()[:-1].decode('utf-8')
+                        self.gdocs_client.batch_append(
+                            self.doc_id,
+                            [('paragraph', feedback), ('code', 'engineevents', events_json)]
+                        )
+                        return
 
         except Exception as e:
-            job.status = 'failed'
             job.error = str(e)
+            self._set_job_status(job, 'failed')
             print(f"Render job {job.job_id} exception: {e}")
             self._append_error("RenderJob", str(e))
 
 
-# Flask HTTP server for render endpoint
-app = Flask(__name__)
+# HTTP server for render endpoint
 bridge_instance = None
+http_config: Dict[str, str] = {}
+
+# Dashboard page; only the doc ID and engine address vary
+_INDEX_TEMPLATE = string.Template("""<!doctype html>
+<html lang="en">
+<head>
+  <meta charset="utf-8"/>
+  <title>JUCE Audio Service – Docs Bridge</title>
+  <meta name="viewport" content="width=device-width, initial-scale=1"/>
+  <style>
+    :root {
+      --fg:#111; --muted:#666; --ok:#0a7; --bg:#fafafa; --card:#fff; --border:#eee;
+      --mono: ui-monospace, SFMono-Regular, Menlo, Monaco, Consolas, "Liberation Mono", monospace;
+      --sans: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif;
+    }
+    body { margin:0; background:var(--bg); color:var(--fg); font-family:var(--sans); }
+    .wrap { max-width:900px; margin:40px auto; padding:0 20px; }
+    .card { background:var(--card); border:1px solid var(--border); border-radius:14px; padding:20px; box-shadow:0 1px 2px rgba(0,0,0,0.03); }
+    h1 { margin:0 0 12px; font-size:22px; }
+    .grid { display:grid; grid-template-columns: 1fr 1fr; gap:14px; margin-top:14px; }
+    .kv { font-family:var(--mono); font-size:14px; padding:10px; background: #fcfcfc; border:1px solid var(--border); border-radius:10px; }
+    a.button { display:inline-block; padding:10px 14px; border-radius:10px; border:1px solid var(--border); text-decoration:none; }
+    .ok { color:var(--ok); font-weight:600; }
+    .muted { color:var(--muted); }
+  </style>
+</head>
+<body>
+  <div class="wrap">
+    <div class="card">
+      <h1>Docs Bridge is running <span class="ok">●</span></h1>
+      <div class="grid">
+        <div class="kv">Doc ID: <strong>$doc_label</strong></div>
+        <div class="kv">Engine: <strong>$server</strong></div>
+      </div>
+      <p style="margin-top:16px">
+        <a class="button" href="/health">Health JSON</a>
+        $doc_link
+        <a class="button" href="https://127.0.0.1:8080" style="display:none">noop</a>
+      </p>
+      <p class="muted">Add an <code>edljson</code> fenced block in the Google Doc to push EDLs automatically.</p>
+    </div>
+  </div>
+</body>
+</html>""")
 
 
-@app.route('/render', methods=['GET'])
-def render_endpoint():
+def render_endpoint(args: Dict[str, List[str]]) -> Tuple[Dict, int]:
     """
     HTTP endpoint for triggering renders.
 
@@ -346,27 +515,30 @@ def render_endpoint():
     global bridge_instance
 
     if not bridge_instance:
-        return jsonify({'error': 'Bridge not initialized'}), 500
+        return {'error': 'Bridge not initialized'}, 500
+
+    def arg(name: str, default: Optional[str] = None) -> Optional[str]:
+        return args.get(name, [default])[0]
 
     # Parse parameters
-    edl_id = request.args.get('edl_id')
-    start_str = request.args.get('start')
-    dur_str = request.args.get('dur')
-    bit_str = request.args.get('bit', '16')
-    out_path = request.args.get('out')
+    edl_id = arg('edl_id')
+    start_str = arg('start')
+    dur_str = arg('dur')
+    bit_str = arg('bit', '16')
+    out_path = arg('out')
 
     if not edl_id or not start_str or not dur_str:
-        return jsonify({'error': 'Missing required parameters: edl_id, start, dur'}), 400
+        return {'error': 'Missing required parameters: edl_id, start, dur'}, 400
 
     try:
         start = float(start_str)
         dur = float(dur_str)
         bit_depth = int(bit_str)
     except ValueError:
-        return jsonify({'error': 'Invalid numeric parameter'}), 400
+        return {'error': 'Invalid numeric parameter'}, 400
 
     if bit_depth not in (16, 24, 32):
-        return jsonify({'error': 'bit_depth must be 16, 24, or 32'}), 400
+        return {'error': 'bit_depth must be 16, 24, or 32'}, 400
 
     # Default output path
     if not out_path:
@@ -375,87 +547,138 @@ def render_endpoint():
     # Enqueue job
     job_id = bridge_instance.enqueue_render(edl_id, start, dur, out_path, bit_depth)
 
-    return jsonify({
+    return {
         'job_id': job_id,
         'status': 'accepted',
-    }), 202
+    }, 202
 
 
-@app.route('/job/<job_id>', methods=['GET'])
-def job_status_endpoint(job_id: str):
+def job_status_endpoint(job_id: str) -> Tuple[Dict, int]:
     """Get status of a render job."""
     global bridge_instance
 
     if not bridge_instance:
-        return jsonify({'error': 'Bridge not initialized'}), 500
+        return {'error': 'Bridge not initialized'}, 500
 
     status = bridge_instance.get_job_status(job_id)
 
     if not status:
-        return jsonify({'error': 'Job not found'}), 404
+        return {'error': 'Job not found'}, 404
 
-    return jsonify(status), 200
+    return status, 200
 
 
-@app.route('/health', methods=['GET'])
-def health():
+def health() -> Tuple[Dict, int]:
     """Health check endpoint."""
-    return jsonify({
+    return {
         'status': 'ok',
-        'doc_id': current_app.config.get('DOC_ID'),
-        'server': current_app.config.get('SERVER_ADDR')
-    }), 200
+        'doc_id': http_config.get('DOC_ID'),
+        'server': http_config.get('SERVER_ADDR')
+    }, 200
+
+
+@functools.lru_cache(maxsize=4)
+def _render_index(doc_id: str, server: str) -> bytes:
+    """Render the dashboard page once per (doc_id, server)."""
+    doc_link = ""
+    if doc_id:
+        doc_url = f"https://docs.google.com/document/d/{doc_id}/edit"
+        doc_link = (
+            f'<a class="button" href="{doc_url}" target="_blank" '
+            f'rel="noopener noreferrer">Open Google Doc</a>'
+        )
+
+    return _INDEX_TEMPLATE.substitute(
+        doc_label=doc_id or "—",
+        server=server,
+        doc_link=doc_link
+    ).encode("utf-8")
 
 
-@app.get("/")
-def index():
+def index() -> bytes:
     """Dashboard showing bridge status and links."""
-    doc_id = current_app.config.get("DOC_ID") or ""
-    server = current_app.config.get("SERVER_ADDR") or "localhost:50051"
-    doc_url = f"https://docs.google.com/document/d/{doc_id}/edit" if doc_id else "#"
+    doc_id = http_config.get("DOC_ID") or ""
+    server = http_config.get("SERVER_ADDR") or "localhost:50051"
+    return _render_index(doc_id, server)
 
-    html = f"""<!doctype html>
-<html lang="en">
-<head>
-  <meta charset="utf-8"/>
-  <title>JUCE Audio Service – Docs Bridge</title>
-  <meta name="viewport" content="width=device-width, initial-scale=1"/>
-  <style>
-    :root {{
-      --fg:#111; --muted:#666; --ok:#0a7; --bg:#fafafa; --card:#fff; --border:#eee;
-      --mono: ui-monospace, SFMono-Regular, Menlo, Monaco, Consolas, "Liberation Mono", monospace;
-      --sans: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif;
-    }}
-    body {{ margin:0; background:var(--bg); color:var(--fg); font-family:var(--sans); }}
-    .wrap {{ max-width:900px; margin:40px auto; padding:0 20px; }}
-    .card {{ background:var(--card); border:1px solid var(--border); border-radius:14px; padding:20px; box-shadow:0 1px 2px rgba(0,0,0,0.03); }}
-    h1 {{ margin:0 0 12px; font-size:22px; }}
-    .grid {{ display:grid; grid-template-columns: 1fr 1fr; gap:14px; margin-top:14px; }}
-    .kv {{ font-family:var(--mono); font-size:14px; padding:10px; background: #fcfcfc; border:1px solid var(--border); border-radius:10px; }}
-    a.button {{ display:inline-block; padding:10px 14px; border-radius:10px; border:1px solid var(--border); text-decoration:none; }}
-    .ok {{ color:var(--ok); font-weight:600; }}
-    .muted {{ color:var(--muted); }}
-  </style>
-</head>
-<body>
-  <div class="wrap">
-    <div class="card">
-      <h1>Docs Bridge is running <span class="ok">●</span></h1>
-      <div class="grid">
-        <div class="kv">Doc ID: <strong>{doc_id or "—"}</strong></div>
-        <div class="kv">Engine: <strong>{server}</strong></div>
-      </div>
-      <p style="margin-top:16px">
-        <a class="button" href="/health">Health JSON</a>
-        {'<a class="button" href="'+doc_url+'" target="_blank" rel="noopener noreferrer">Open Google Doc</a>' if doc_id else ''}
-        <a class="button" href="https://127.0.0.1:8080" style="display:none">noop</a>
-      </p>
-      <p class="muted">Add an <code>edljson</code> fenced block in the Google Doc to push EDLs automatically.</p>
-    </div>
-  </div>
-</body>
-</html>"""
-    return Response(html, mimetype="text/html")
+
+class BridgeRequestHandler(BaseHTTPRequestHandler):
+    """Routes GET requests to the endpoint functions above."""
+
+    server_version = "DocsBridge/1.0"
+
+    # Socket timeout: an idle or trickling connection (e.g. a browser preconnect)
+    # may otherwise hold one of the fixed --http-threads forever
+    timeout = 10
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        path = url.path
+
+        if path == '/render':
+            self._send_json(*render_endpoint(parse_qs(url.query)))
+        elif path.startswith('/job/') and len(path) > len('/job/'):
+            self._send_json(*job_status_endpoint(unquote(path[len('/job/'):])))
+        elif path == '/health':
+            self._send_json(*health())
+        elif path == '/':
+            self._send(200, index(), 'text/html; charset=utf-8', {'Cache-Control': 'public, max-age=300'})
+        else:
+            self._send_json({'error': 'Not found'}, 404)
+
+    def _send_json(self, payload: Dict, status: int):
+        self._send(status, orjson.dumps(payload), 'application/json')
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: Optional[Dict[str, str]] = None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class BridgeHTTPServer(HTTPServer):
+    """HTTP server that handles requests on a fixed-size thread pool."""
+
+    def __init__(self, server_address, handler_class, threads: int):
+        super().__init__(server_address, handler_class)
+        self._executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix='http')
+
+    def process_request(self, request, client_address):
+        self._executor.submit(self._process_request_worker, request, client_address)
+
+    def _process_request_worker(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self._executor.shutdown(wait=False)
+
+
+def _handle_sigterm(signum, frame):
+    """Unwind the HTTP server loop so main() runs the normal shutdown path."""
+    raise KeyboardInterrupt
+
+
+def serve_http(port: int, threads: int):
+    """
+    Serve the HTTP endpoints on all interfaces until interrupted.
+
+    Runs in this process, so every request sees the same bridge_instance
+    (job registry, worker pool).
+    """
+    httpd = BridgeHTTPServer(('0.0.0.0', port), BridgeRequestHandler, threads)
+    try:
+        httpd.serve_forever()
+    finally:
+        httpd.server_close()
 
 
 def main():
@@ -464,11 +687,16 @@ def main():
     parser.add_argument('--doc-id', required=True, help='Google Doc ID to watch')
     parser.add_argument('--server', default='localhost:50051', help='gRPC server address')
     parser.add_argument('--poll-interval', type=float, default=3.0, help='Polling interval in seconds')
+    parser.add_argument('--pubsub-subscription', help='Pub/Sub subscription path for doc change notifications (disables polling)')
     parser.add_argument('--credentials', help='Path to OAuth credentials or service account key (GOOGLE_APPLICATION_CREDENTIALS)')
     parser.add_argument('--oauth-client', help='Path to OAuth client JSON file')
     parser.add_argument('--token', help='Path to OAuth token file (override default)')
     parser.add_argument('--creds-mode', default='installed', choices=['installed'], help='Credentials mode (only "installed" supported)')
     parser.add_argument('--http-port', type=int, default=5000, help='HTTP server port')
+    parser.add_argument('--http-threads', type=int, default=8, help='HTTP request handler threads')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Number of render worker threads (default: 1, one render at a time; '
+                             'higher values send concurrent RenderEdlWindow calls to the engine)')
     parser.add_argument('--verbose', action='store_true', help='Enable verbose logging (shows resolved paths + scopes)')
 
     args = parser.parse_args()
@@ -482,6 +710,8 @@ def main():
         credentials_path=args.credentials,
         oauth_client_path=args.oauth_client,
         token_path=args.token,
+        pubsub_subscription=args.pubsub_subscription,
+        workers=args.workers,
         verbose=args.verbose
     )
 
@@ -489,18 +719,20 @@ def main():
         print("\n❌ Failed to start bridge")
         return 1
 
-    # Configure Flask app
-    app.config['DOC_ID'] = args.doc_id
-    app.config['SERVER_ADDR'] = args.server
+    signal.signal(signal.SIGTERM, _handle_sigterm)
+
+    # Configure HTTP endpoints
+    http_config['DOC_ID'] = args.doc_id
+    http_config['SERVER_ADDR'] = args.server
 
-    # Start Flask HTTP server
+    # Start HTTP server
     if args.verbose:
-        print(f"\n[bridge] Starting HTTP server on 0.0.0.0:{args.http_port}")
+        print(f"\n[bridge] Starting HTTP server on 0.0.0.0:{args.http_port} ({args.http_threads} threads)")
     else:
         print(f"Starting HTTP server on port {args.http_port}...")
 
     try:
-        app.run(host='0.0.0.0', port=args.http_port, debug=False)
+        serve_http(args.http_port, args.http_threads)
     except KeyboardInterrupt:
         print("\nShutting down...")
     finally:
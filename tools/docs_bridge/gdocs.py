@@ -1,24 +1,75 @@
 """Google Docs API integration with OAuth and service account support."""
 
 from __future__ import annotations
-import json
+import functools
 import os
 import pathlib
+import random
 import sys
-from typing import Optional, Tuple
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
 
+import google_auth_httplib2
+import orjson
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google.oauth2 import service_account
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
+from googleapiclient.model import JsonModel
+
+# Upper bound on inserted text per batchUpdate (a single larger op is sent alone)
+MAX_BATCH_CHARS = 500_000
+
+# batchUpdate failures retried with backoff. Only 429: the request was rejected unapplied,
+# whereas a 500/503 may follow an applied update and a resend would append it twice
+RETRY_STATUSES = (429,)
+MAX_APPEND_ATTEMPTS = 6
+
+# Retries sleep while holding the doc's append lock, so bound each wait and their total
+MAX_RETRY_DELAY = 60.0
+MAX_RETRY_WAIT = 120.0
+
+# Font applied to appended code blocks
+CODE_FONT_FAMILY = 'Roboto Mono'
+
+# Home directory and repo-local OAuth client fallback, looked up once
+_HOME = os.path.expanduser('~')
+_REPO_OAUTH_CLIENT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'oauth_client.json')
 
 # Google API scopes
-SCOPES = [
+SCOPES = (
     'https://www.googleapis.com/auth/documents',
     'https://www.googleapis.com/auth/drive.readonly',
-]
+)
+
+# Fixed fields of an 'installed' OAuth client config; client id/secret come from env
+_INSTALLED_APP_TEMPLATE = {
+    "auth_uri": "https://accounts.google.com/o/oauth2/auth",
+    "token_uri": "https://oauth2.googleapis.com/token",
+    "auth_provider_x509_cert_url": "https://www.googleapis.com/oauth2/v1/certs",
+}
+
+
+class OrjsonModel(JsonModel):
+    """JsonModel that parses and serializes API bodies with orjson."""
+
+    def serialize(self, body_value):
+        if isinstance(body_value, dict) and 'data' not in body_value and self._data_wrapper:
+            body_value = {'data': body_value}
+        return orjson.dumps(body_value)
+
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return content.decode('utf-8') if isinstance(content, bytes) else content
+        if self._data_wrapper and 'data' in body:
+            body = body['data']
+        return body
 
 
 def resolve_oauth_client_path(
@@ -32,57 +83,111 @@ def resolve_oauth_client_path(
       2) $GOOGLE_OAUTH_CLIENT_JSON (absolute path or inline JSON)
       3) XDG path: $XDG_CONFIG_HOME/juce-audio-service/google/oauth_client.json
       4) macOS/Linux default: ~/.config/juce-audio-service/google/oauth_client.json
+         (only when $XDG_CONFIG_HOME is unset)
       5) repo fallback: tools/docs_bridge/oauth_client.json  (if present)
 
     If $GOOGLE_OAUTH_CLIENT_JSON looks like a JSON object (starts with '{'),
     write it to a temp file under ~/.config/juce-audio-service/google/oauth_client.json
     and return that path (source='env-inline').
+
+    Results are memoized per (cli_path, $GOOGLE_OAUTH_CLIENT_JSON, $XDG_CONFIG_HOME);
+    call resolve_oauth_client_path.cache_clear() after changing files on disk.
     """
-    def cfg_dir() -> pathlib.Path:
-        base = os.environ.get("XDG_CONFIG_HOME") or os.path.join(pathlib.Path.home(), ".config")
-        return pathlib.Path(base) / "juce-audio-service" / "google"
+    return _resolve_oauth_client_path(
+        cli_path,
+        os.environ.get("GOOGLE_OAUTH_CLIENT_JSON"),
+        os.environ.get("XDG_CONFIG_HOME"),
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_oauth_client_path(
+    cli_path: Optional[str],
+    env: Optional[str],
+    xdg_base: Optional[str]
+) -> Tuple[Optional[pathlib.Path], str]:
+    """Memoized resolver behind resolve_oauth_client_path, keyed on its inputs."""
+    config_dir = os.path.join(xdg_base or os.path.join(_HOME, ".config"), "juce-audio-service", "google")
 
     # 1) CLI
     if cli_path:
-        p = pathlib.Path(cli_path).expanduser().resolve()
-        if p.exists():
-            return p, "cli"
+        p = os.path.expanduser(cli_path)
+        if os.path.isfile(p):
+            return pathlib.Path(p), "cli"
         # fallthrough (still report later)
 
     # 2) ENV (either path or inline JSON)
-    env = os.environ.get("GOOGLE_OAUTH_CLIENT_JSON")
     if env:
         if env.strip().startswith("{"):
-            cfg_dir().mkdir(parents=True, exist_ok=True)
-            p = cfg_dir() / "oauth_client.json"
-            p.write_text(env, encoding="utf-8")
-            os.chmod(p, 0o600)
-            return p, "env-inline"
+            os.makedirs(config_dir, exist_ok=True)
+            p = os.path.join(config_dir, "oauth_client.json")
+            write_private_file(p, env)
+            return pathlib.Path(p), "env-inline"
         else:
-            p = pathlib.Path(env).expanduser().resolve()
-            if p.exists():
-                return p, "env-path"
-
-    # 3) XDG
-    xdg_base = os.environ.get("XDG_CONFIG_HOME")
-    if xdg_base:
-        p = pathlib.Path(xdg_base) / "juce-audio-service" / "google" / "oauth_client.json"
-        if p.exists():
-            return p, "xdg"
-
-    # 4) Default ~/.config
-    p = pathlib.Path.home() / ".config" / "juce-audio-service" / "google" / "oauth_client.json"
-    if p.exists():
-        return p, "home-config"
+            p = os.path.expanduser(env)
+            if os.path.isfile(p):
+                return pathlib.Path(p), "env-path"
+
+    # 3) + 4) Config dir: $XDG_CONFIG_HOME takes precedence over ~/.config
+    p = os.path.join(config_dir, "oauth_client.json")
+    if os.path.isfile(p):
+        return pathlib.Path(p), "xdg" if xdg_base else "home-config"
 
     # 5) Repo fallback
-    repo = pathlib.Path(__file__).resolve().parent / "oauth_client.json"
-    if repo.exists():
-        return repo.resolve(), "repo-fallback"
+    if os.path.isfile(_REPO_OAUTH_CLIENT):
+        return pathlib.Path(_REPO_OAUTH_CLIENT), "repo-fallback"
 
     return None, "not-found"
 
 
+resolve_oauth_client_path.cache_clear = _resolve_oauth_client_path.cache_clear
+
+
+def write_private_file(path: str, text: str):
+    """Write text to a file readable only by the owner, created with mode 0600 from the start."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_CLOEXEC', 0), 0o600)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        # The mode above only applies on creation; tighten a pre-existing file too
+        if hasattr(os, 'fchmod'):
+            os.fchmod(fd, 0o600)
+        f.write(text)
+
+
+def utf16_len(text: str) -> int:
+    """Length of text in UTF-16 code units, the unit Docs API indexes use."""
+    # Without astral characters (no surrogate pairs) the count equals len(); skip the encode copy
+    if not text or text.isascii() or max(text) < '\U00010000':
+        return len(text)
+    return len(text.encode('utf-16-le')) // 2
+
+
+def split_text(text: str, chunk_size: int) -> List[str]:
+    """Split text into pieces of at most chunk_size characters, cutting after a newline where possible."""
+    pieces = []
+    start = 0
+    while len(text) - start > chunk_size:
+        cut = text.rfind('\n', start, start + chunk_size)
+        end = cut + 1 if cut > start else start + chunk_size
+        pieces.append(text[start:end])
+        start = end
+    pieces.append(text[start:])
+    return pieces
+
+
+def _retry_delay(e: HttpError, attempt: int) -> float:
+    """
+    Seconds to wait before retry number attempt: the server's Retry-After, else
+    jittered 2**attempt, capped at MAX_RETRY_DELAY.
+    """
+    retry_after = e.resp.get('retry-after')
+    if retry_after:
+        try:
+            return min(max(0.0, float(retry_after)), MAX_RETRY_DELAY)
+        except ValueError:
+            pass  # HTTP-date form; fall back to backoff
+    return min(2 ** attempt + random.random(), MAX_RETRY_DELAY)
+
+
 def build_installed_app_creds_json_from_env() -> Optional[dict]:
     """
     If GOOGLE_OAUTH_CLIENT_ID and GOOGLE_OAUTH_CLIENT_SECRET are set,
@@ -94,11 +199,9 @@ def build_installed_app_creds_json_from_env() -> Optional[dict]:
         return None
     return {
         "installed": {
+            **_INSTALLED_APP_TEMPLATE,
             "client_id": cid,
             "project_id": os.environ.get("GOOGLE_OAUTH_PROJECT_ID", "juce-audio-service"),
-            "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-            "token_uri": "https://oauth2.googleapis.com/token",
-            "auth_provider_x509_cert_url": "https://www.googleapis.com/oauth2/v1/certs",
             "client_secret": csec,
             "redirect_uris": ["http://localhost"]
         }
@@ -122,13 +225,23 @@ class GoogleDocsClient:
         self.creds = None
         self.docs_service = None
         self.drive_service = None
+        self._local = threading.local()
+
+        # (end-of-body insertion index, revision it belongs to) per doc, advanced locally
+        # after each append. Appends pin that revision, so an edit made since fails
+        # the write instead of landing it mid-document.
+        # Per-doc locks serialize appends to one doc; different docs proceed in parallel.
+        self._end_index_cache: Dict[str, Tuple[int, str]] = {}
+        self._append_locks: Dict[str, threading.RLock] = {}
+        self._append_locks_guard = threading.Lock()
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def _default_token_path() -> str:
         """Get default token path."""
-        config_dir = pathlib.Path.home() / '.config' / 'juce-audio-service' / 'google'
-        config_dir.mkdir(parents=True, exist_ok=True)
-        return str(config_dir / 'token.json')
+        config_dir = os.path.join(_HOME, '.config', 'juce-audio-service', 'google')
+        os.makedirs(config_dir, exist_ok=True)
+        return os.path.join(config_dir, 'token.json')
 
     def authenticate(
         self,
@@ -160,22 +273,22 @@ class GoogleDocsClient:
         # Try service account first
         if self.credentials_path and pathlib.Path(self.credentials_path).exists():
             try:
-                # Check if it's a service account key
-                with open(self.credentials_path, 'r') as f:
-                    key_data = json.load(f)
-                    if key_data.get('type') == 'service_account':
-                        if verbose:
-                            print("[gdocs] OAuth mode: service-account")
-                            print(f"[gdocs] Credentials source: GOOGLE_APPLICATION_CREDENTIALS")
-                            print(f"[gdocs] Credentials path: {self.credentials_path}")
-                            print(f"[gdocs] Scopes: {', '.join(SCOPES)}")
-
-                        self.creds = service_account.Credentials.from_service_account_file(
-                            self.credentials_path,
-                            scopes=SCOPES
-                        )
-                        self._build_services()
-                        return True
+                # Check if it's a service account key; Google writes "type" first, so peek instead of parsing
+                with open(self.credentials_path, 'rb') as f:
+                    is_service_account = b'"service_account"' in f.read(512)
+                if is_service_account:
+                    if verbose:
+                        print("[gdocs] OAuth mode: service-account")
+                        print(f"[gdocs] Credentials source: GOOGLE_APPLICATION_CREDENTIALS")
+                        print(f"[gdocs] Credentials path: {self.credentials_path}")
+                        print(f"[gdocs] Scopes: {', '.join(SCOPES)}")
+
+                    self.creds = service_account.Credentials.from_service_account_file(
+                        self.credentials_path,
+                        scopes=SCOPES
+                    )
+                    self._build_services()
+                    return True
             except Exception as e:
                 if verbose:
                     print(f"[gdocs] Failed to load service account: {e}")
@@ -208,12 +321,9 @@ class GoogleDocsClient:
             if xdg_base:
                 print(f"  4. XDG config: {xdg_base}/juce-audio-service/google/oauth_client.json")
             else:
-                print("  4. XDG config: (not set)")
+                print(f"  4. Home config: {_HOME}/.config/juce-audio-service/google/oauth_client.json")
 
-            print(f"  5. Home config: {pathlib.Path.home()}/.config/juce-audio-service/google/oauth_client.json")
-
-            repo_path = pathlib.Path(__file__).resolve().parent / "oauth_client.json"
-            print(f"  6. Repo fallback: {repo_path}")
+            print(f"  5. Repo fallback: {_REPO_OAUTH_CLIENT}")
 
             print("\nTo fix this, choose one option:")
             print("  A. Place OAuth client JSON at: ~/.config/juce-audio-service/google/oauth_client.json")
@@ -269,10 +379,7 @@ class GoogleDocsClient:
             token_dir = pathlib.Path(self.token_path).parent
             token_dir.mkdir(parents=True, exist_ok=True)
 
-            with open(self.token_path, 'w') as token:
-                token.write(self.creds.to_json())
-
-            os.chmod(self.token_path, 0o600)
+            write_private_file(self.token_path, self.creds.to_json())
 
             if verbose:
                 print(f"[gdocs] Token saved to: {self.token_path}")
@@ -282,37 +389,64 @@ class GoogleDocsClient:
 
     def _build_services(self):
         """Build API service clients."""
-        self.docs_service = build('docs', 'v1', credentials=self.creds)
-        self.drive_service = build('drive', 'v3', credentials=self.creds)
-
-    def get_doc_content(self, doc_id: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        # Use the discovery docs bundled with the client library; no discovery fetch or cache
+        self.docs_service = build(
+            'docs', 'v1', credentials=self.creds, model=OrjsonModel(),
+            static_discovery=True, cache_discovery=False
+        )
+        self.drive_service = build(
+            'drive', 'v3', credentials=self.creds, model=OrjsonModel(),
+            static_discovery=True, cache_discovery=False
+        )
+
+    def _http(self) -> google_auth_httplib2.AuthorizedHttp:
+        """Get this thread's authorized transport (httplib2.Http is not thread-safe)."""
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            # build_http() sets googleapiclient's default socket timeout, so a stalled connection
+            # cannot hold a per-doc append lock forever
+            http = google_auth_httplib2.AuthorizedHttp(self.creds, http=build_http())
+            self._local.http = http
+        return http
+
+    def get_doc_content(
+        self,
+        doc_id: str,
+        revision_id: Optional[str] = None
+    ) -> Tuple[Optional[str], Optional[str], Optional[str]]:
         """
         Retrieve document content and revision ID.
 
         Args:
             doc_id: Google Doc ID
+            revision_id: Head revision already known to the caller (e.g. from
+                         get_head_revision_id); skips the Drive metadata request
 
         Returns:
             Tuple of (content, revision_id, error_message)
             Returns (None, None, error) on failure
         """
-        if not self.docs_service or not self.drive_service:
+        if not self.drive_service:
             return None, None, "Client not authenticated"
 
         try:
-            # Get document content
-            doc = self.docs_service.documents().get(documentId=doc_id).execute()
+            # Let Drive render the plain text server-side instead of walking the Docs JSON
+            data = self.drive_service.files().export(
+                fileId=doc_id,
+                mimeType='text/plain'
+            ).execute(http=self._http())
 
-            # Extract text content
-            content = self._extract_text(doc)
+            # Export is BOM-prefixed UTF-8 with CRLF line endings
+            content = data.decode('utf-8-sig').replace('\r\n', '\n')
 
             # Get revision ID from Drive API
-            file_metadata = self.drive_service.files().get(
-                fileId=doc_id,
-                fields='headRevisionId'
-            ).execute()
+            if revision_id is None:
+                file_metadata = self.drive_service.files().get(
+                    fileId=doc_id,
+                    fields='headRevisionId'
+                ).execute(http=self._http())
 
-            revision_id = file_metadata.get('headRevisionId', '')
+                revision_id = file_metadata.get('headRevisionId', '')
 
             return content, revision_id, None
 
@@ -322,92 +456,263 @@ class GoogleDocsClient:
         except Exception as e:
             return None, None, f"Unexpected error: {e}"
 
-    def _extract_text(self, doc: dict) -> str:
+    def get_head_revision_id(self, doc_id: str) -> Tuple[Optional[str], Optional[str]]:
         """
-        Extract plain text from document structure.
+        Retrieve only the head revision ID of a document.
+
+        Much cheaper than get_doc_content: the response carries a single field.
 
         Args:
-            doc: Document JSON from API
+            doc_id: Google Doc ID
 
         Returns:
-            Plain text content
+            Tuple of (revision_id, error_message)
+            Returns (None, error) on failure
         """
-        content_parts = []
-
-        body = doc.get('body', {})
-        content = body.get('content', [])
-
-        for element in content:
-            if 'paragraph' in element:
-                paragraph = element['paragraph']
-                paragraph_text = self._extract_paragraph_text(paragraph)
-                if paragraph_text:
-                    content_parts.append(paragraph_text)
-
-            elif 'table' in element:
-                # Handle tables (extract all text)
-                table = element['table']
-                for row in table.get('tableRows', []):
-                    for cell in row.get('tableCells', []):
-                        for cell_content in cell.get('content', []):
-                            if 'paragraph' in cell_content:
-                                para_text = self._extract_paragraph_text(cell_content['paragraph'])
-                                if para_text:
-                                    content_parts.append(para_text)
-
-        return '\n'.join(content_parts)
-
-    def _extract_paragraph_text(self, paragraph: dict) -> str:
-        """Extract text from a paragraph element."""
-        text_parts = []
-
-        for element in paragraph.get('elements', []):
-            text_run = element.get('textRun')
-            if text_run:
-                text_parts.append(text_run.get('content', ''))
-
-        return ''.join(text_parts)
+        if not self.drive_service:
+            return None, "Client not authenticated"
 
-    def append_paragraph(self, doc_id: str, text: str) -> Optional[str]:
+        try:
+            file_metadata = self.drive_service.files().get(
+                fileId=doc_id,
+                fields='headRevisionId'
+            ).execute(http=self._http())
+
+            return file_metadata.get('headRevisionId', ''), None
+
+        except HttpError as e:
+            return None, f"HTTP error {e.resp.status}: {e.error_details}"
+        except Exception as e:
+            return None, f"Unexpected error: {e}"
+
+    def _append_lock(self, doc_id: str) -> threading.RLock:
+        """Get the lock that serializes appends to a document."""
+        with self._append_locks_guard:
+            lock = self._append_locks.get(doc_id)
+            if lock is None:
+                lock = self._append_locks[doc_id] = threading.RLock()
+            return lock
+
+    def invalidate_end_index(self, doc_id: str):
+        """Forget the cached end index of a document (e.g. after an external edit)."""
+        with self._append_lock(doc_id):
+            self._end_index_cache.pop(doc_id, None)
+
+    def _get_end_index(self, doc_id: str) -> Tuple[int, str]:
+        """Return (insertion index at the end of the body, its revision ID), fetching on a cache miss."""
+        cached = self._end_index_cache.get(doc_id)
+        if cached is None:
+            doc = self.docs_service.documents().get(
+                documentId=doc_id,
+                fields='revisionId,body(content(endIndex))'
+            ).execute(http=self._http())
+            cached = (doc['body']['content'][-1]['endIndex'] - 1, doc['revisionId'])
+            self._end_index_cache[doc_id] = cached
+        return cached
+
+    def _append_requests(
+        self,
+        doc_id: str,
+        build: Callable[[int], Tuple[List[dict], int]]
+    ) -> Optional[str]:
         """
-        Append a paragraph to the end of the document.
+        Issue one batchUpdate that inserts at the end of the document.
 
         Args:
             doc_id: Google Doc ID
-            text: Text to append
+            build: Called with the insertion index; returns (requests, end index after insert)
 
         Returns:
             Error message if failed, None on success
         """
+        with self._append_lock(doc_id):
+            # The index is only valid at its revision; an edit since then (by anyone)
+            # fails the pinned write with 400, so refetch and retry once
+            retry = True
+            attempt = 0
+            waited = 0.0
+            while True:
+                attempt += 1
+                try:
+                    start_index, revision_id = self._get_end_index(doc_id)
+                    requests, end_index = build(start_index)
+
+                    reply = self.docs_service.documents().batchUpdate(
+                        documentId=doc_id,
+                        body={
+                            'requests': requests,
+                            'writeControl': {'requiredRevisionId': revision_id}
+                        }
+                    ).execute(http=self._http())
+
+                    # The reply carries the revision after this write; without it, refetch next time
+                    new_revision_id = reply.get('writeControl', {}).get('requiredRevisionId')
+                    if new_revision_id:
+                        self._end_index_cache[doc_id] = (end_index, new_revision_id)
+                    else:
+                        self._end_index_cache.pop(doc_id, None)
+                    return None
+
+                except HttpError as e:
+                    self._end_index_cache.pop(doc_id, None)
+                    if retry and e.resp.status in (400, 409):
+                        retry = False
+                        continue
+                    # Rate limited (nothing applied): back off within the wait budget and retry
+                    if e.resp.status in RETRY_STATUSES and attempt < MAX_APPEND_ATTEMPTS:
+                        delay = _retry_delay(e, attempt - 1)
+                        if waited + delay <= MAX_RETRY_WAIT:
+                            time.sleep(delay)
+                            waited += delay
+                            continue
+                    return f"HTTP error {e.resp.status}: {e.error_details}"
+                except Exception as e:
+                    self._end_index_cache.pop(doc_id, None)
+                    return f"Unexpected error: {e}"
+
+    def batch_append(self, doc_id: str, ops: List[tuple], chunk_size: int = 0) -> Optional[str]:
+        """
+        Append headings, code blocks and paragraphs at the end of the document.
+
+        Ops are sent in one batchUpdate, or in consecutive batchUpdates of about
+        MAX_BATCH_CHARS each for very large appends (split between ops only). Headings get their paragraph
+        style and code blocks are set in CODE_FONT_FAMILY within the same request.
+
+        Args:
+            doc_id: Google Doc ID
+            ops: Operations in document order, each one of
+                 ("heading", text, level), ("code", language, content), ("paragraph", text)
+            chunk_size: If > 0, split code and paragraph text into insertText requests
+                        of at most this many characters, at line ends where possible
+                        (headings are never split)
+
+        Returns:
+            Error message if failed, None on success. If a later batch fails, the
+            message ends with how many leading ops were already appended.
+        """
         if not self.docs_service:
             return "Client not authenticated"
 
-        try:
-            # Get document to find end index
-            doc = self.docs_service.documents().get(documentId=doc_id).execute()
-            end_index = doc['body']['content'][-1]['endIndex'] - 1
-
-            # Build insert request
-            requests = [
-                {
-                    'insertText': {
-                        'location': {'index': end_index},
-                        'text': f'\n{text}\n'
-                    }
+        if not ops:
+            return None
+
+        for op in ops:
+            if op[0] == 'heading':
+                if op[2] < 1 or op[2] > 6:
+                    return "Heading level must be between 1 and 6"
+            elif op[0] not in ('code', 'paragraph'):
+                return f"Unknown append operation: {op[0]}"
+
+        # Split into several batchUpdates so no single request body grows unbounded. Splits
+        # fall only between ops, so a failed batch never leaves half an op (e.g. an open fence)
+        batches: List[List[Tuple[tuple, str]]] = [[]]
+        batch_ops: List[int] = [0]
+        batch_chars = 0
+        for op in ops:
+            if op[0] == 'code':
+                head, body, tail = ''.join(('\n```', op[1], '\n')), op[2], '\n```\n'
+            else:
+                head, body, tail = '\n', op[1], '\n'
+            if chunk_size > 0 and op[0] != 'heading' and len(head) + len(body) + len(tail) > chunk_size:
+                # Split the body alone so large content is never also copied into one wrapped string
+                pieces = [piece for piece in (head, *split_text(body, chunk_size), tail) if piece]
+            else:
+                # Build each inserted paragraph, fences included, in a single join
+                pieces = [''.join((head, body, tail))]
+
+            op_chars = sum(len(piece) for piece in pieces)
+            if batches[-1] and batch_chars + op_chars > MAX_BATCH_CHARS:
+                batches.append([])
+                batch_ops.append(0)
+                batch_chars = 0
+            batches[-1].extend((op, piece) for piece in pieces)
+            batch_ops[-1] += 1
+            batch_chars += op_chars
+
+        # Hold the lock across batches so they land contiguously
+        applied = 0
+        with self._append_lock(doc_id):
+            for batch, op_count in zip(batches, batch_ops):
+                error = self._append_requests(doc_id, lambda cursor: self._build_append(batch, cursor))
+                if error:
+                    if applied:
+                        # Earlier batches are already in the doc; say so, so a caller can resume
+                        return f"{error} (first {applied} of {len(ops)} ops already appended)"
+                    return error
+                applied += op_count
+        return None
+
+    @staticmethod
+    def _build_append(batch: List[Tuple[tuple, str]], cursor: int) -> Tuple[List[dict], int]:
+        """Build insert/style requests for (op, newline-wrapped text) pairs, advancing the cursor locally."""
+        requests = []
+        for op, text in batch:
+            text_len = utf16_len(text)
+
+            requests.append({
+                'insertText': {
+                    'location': {'index': cursor},
+                    'text': text
                 }
-            ]
+            })
+            if op[0] == 'heading':
+                requests.append({
+                    'updateParagraphStyle': {
+                        'range': {
+                            'startIndex': cursor + 1,
+                            'endIndex': cursor + text_len - 1
+                        },
+                        'paragraphStyle': {
+                            'namedStyleType': f'HEADING_{op[2]}'
+                        },
+                        'fields': 'namedStyleType'
+                    }
+                })
+            elif op[0] == 'code':
+                # Style the piece minus its wrapping newlines; chunked pieces may lack either
+                start = cursor + 1 if text.startswith('\n') else cursor
+                end = cursor + text_len - 1 if text.endswith('\n') else cursor + text_len
+                if end > start:
+                    requests.append({
+                        'updateTextStyle': {
+                            'range': {
+                                'startIndex': start,
+                                'endIndex': end
+                            },
+                            'textStyle': {
+                                'weightedFontFamily': {'fontFamily': CODE_FONT_FAMILY}
+                            },
+                            'fields': 'weightedFontFamily'
+                        }
+                    })
+            cursor += text_len
+        return requests, cursor
 
-            self.docs_service.documents().batchUpdate(
-                documentId=doc_id,
-                body={'requests': requests}
-            ).execute()
+    def append_paragraph(self, doc_id: str, text: str) -> Optional[str]:
+        """
+        Append a paragraph to the end of the document.
 
-            return None
+        Args:
+            doc_id: Google Doc ID
+            text: Text to append
 
-        except HttpError as e:
-            return f"HTTP error {e.resp.status}: {e.error_details}"
-        except Exception as e:
-            return f"Unexpected error: {e}"
+        Returns:
+            Error message if failed, None on success
+        """
+        return self.batch_append(doc_id, [('paragraph', text)])
+
+    def append_many(self, doc_id: str, paragraphs: List[str]) -> Optional[str]:
+        """
+        Append several paragraphs to the end of the document in one batchUpdate.
+
+        Args:
+            doc_id: Google Doc ID
+            paragraphs: Texts to append, in order
+
+        Returns:
+            Error message if failed, None on success
+        """
+        return self.batch_append(doc_id, [('paragraph', text) for text in paragraphs])
 
     def append_code_block(self, doc_id: str, language: str, content: str) -> Optional[str]:
         """
@@ -421,8 +726,7 @@ class GoogleDocsClient:
         Returns:
             Error message if failed, None on success
         """
-        code_block = f'```{language}\n{content}\n```'
-        return self.append_paragraph(doc_id, code_block)
+        return self.batch_append(doc_id, [('code', language, content)])
 
     def append_heading(self, doc_id: str, text: str, level: int = 2) -> Optional[str]:
         """
@@ -436,47 +740,4 @@ class GoogleDocsClient:
         Returns:
             Error message if failed, None on success
         """
-        if not self.docs_service:
-            return "Client not authenticated"
-
-        if level < 1 or level > 6:
-            return "Heading level must be between 1 and 6"
-
-        try:
-            # Get document to find end index
-            doc = self.docs_service.documents().get(documentId=doc_id).execute()
-            end_index = doc['body']['content'][-1]['endIndex'] - 1
-
-            # Insert text and style as heading
-            requests = [
-                {
-                    'insertText': {
-                        'location': {'index': end_index},
-                        'text': f'\n{text}\n'
-                    }
-                },
-                {
-                    'updateParagraphStyle': {
-                        'range': {
-                            'startIndex': end_index + 1,
-                            'endIndex': end_index + 1 + len(text)
-                        },
-                        'paragraphStyle': {
-                            'namedStyleType': f'HEADING_{level}'
-                        },
-                        'fields': 'namedStyleType'
-                    }
-                }
-            ]
-
-            self.docs_service.documents().batchUpdate(
-                documentId=doc_id,
-                body={'requests': requests}
-            ).execute()
-
-            return None
-
-        except HttpError as e:
-            return f"HTTP error {e.resp.status}: {e.error_details}"
-        except Exception as e:
-            return f"Unexpected error: {e}"
\ No newline at end of file
+        return self.batch_append(doc_id, [('heading', text, level)])
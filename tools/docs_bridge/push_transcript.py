@@ -6,9 +6,13 @@ Push transcript (and optional SRT) to Google Doc with version stamping.
 """
 
 import argparse
+import json
+import mmap
+import os
+import stat
 import sys
-import pathlib
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 
 SIGNATURE = "PUSH_TRANSCRIPT_HELP_SIGNATURE_V2"
 VERSION = "2.0"
@@ -23,11 +27,88 @@ def eprint(*args, **kwargs):
 
 
 def load_text(path: str) -> str:
-    """Load text file, raising FileNotFoundError if missing."""
-    p = pathlib.Path(path)
-    if not p.exists() or not p.is_file():
-        raise FileNotFoundError(f"File not found: {p}")
-    return p.read_text(encoding="utf-8", errors="replace")
+    """Load text file, raising FileNotFoundError if missing or not a regular file."""
+    # Open first and check the descriptor: one open + fstat instead of separate path stats
+    try:
+        f = open(path, "rb")
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        raise FileNotFoundError(f"File not found: {path}") from None
+
+    # Decode straight from the page cache so the raw bytes are never copied onto the heap
+    with f:
+        st = os.fstat(f.fileno())
+        if not stat.S_ISREG(st.st_mode):
+            raise FileNotFoundError(f"File not found: {path}")
+        if st.st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            text = str(mm, "utf-8", "replace")
+
+    # Match read_text()'s universal-newline translation
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def build_ops(title: str, txt_content: str, srt_content: Optional[str] = None) -> List[tuple]:
+    """Build the batch_append ops for one transcript section (and optional SRT section)."""
+    ops = [
+        ("heading", f"Transcript — {title}", 2),
+        ("code", "text", txt_content),
+    ]
+    if srt_content is not None:
+        ops.append(("heading", "Subtitles (.srt)", 3))
+        ops.append(("code", "srt", srt_content))
+    return ops
+
+
+def push_one(
+    client: GoogleDocsClient,
+    doc_id: str,
+    title: str,
+    txt: str,
+    srt: Optional[str] = None,
+    chunk_size: int = 0
+) -> Optional[str]:
+    """Push one transcript (and optional SRT). Returns error message if failed, None on success."""
+    # Heading, transcript and optional SRT section go out in one batchUpdate
+    ops = build_ops(title, load_text(txt), load_text(srt) if srt else None)
+    return client.batch_append(doc_id, ops, chunk_size=chunk_size)
+
+
+def load_manifest(path: str) -> List[dict]:
+    """Load push jobs from a JSON-lines manifest, one {doc_id, title, txt, srt?} object per line."""
+    jobs = []
+    with open(path, encoding="utf-8") as f:
+        for lineno, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            job = json.loads(line)
+            missing = [k for k in ("doc_id", "title", "txt") if not job.get(k)]
+            if missing:
+                raise ValueError(f"{path}:{lineno}: missing {', '.join(missing)}")
+            jobs.append(job)
+    return jobs
+
+
+def push_manifest(client: GoogleDocsClient, jobs: List[dict], concurrency: int, chunk_size: int = 0) -> int:
+    """Push all manifest jobs concurrently (each push is network-bound). Returns exit code."""
+    def run(job: dict) -> Optional[str]:
+        try:
+            return push_one(client, job["doc_id"], job["title"], job["txt"], job.get("srt"), chunk_size)
+        except Exception as e:
+            return str(e)
+
+    failed = 0
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        for job, error in zip(jobs, pool.map(run, jobs)):
+            if error:
+                failed += 1
+                eprint(f"ERROR: Failed to push {job['txt']} to {job['doc_id']}: {error}")
+            else:
+                print(f"Pushed transcript to document: {job['doc_id']}")
+
+    return 1 if failed else 0
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -40,6 +121,13 @@ def build_parser() -> argparse.ArgumentParser:
     ap.add_argument("--title", required=False, help="Section title to insert in the doc")
     ap.add_argument("--txt", required=False, help="Path to transcript .txt")
     ap.add_argument("--srt", required=False, help="Path to subtitles .srt (optional)")
+    ap.add_argument("--manifest", help="JSON-lines file of pushes ({doc_id, title, txt, srt?} per line); "
+                                       "replaces --doc-id/--title/--txt/--srt")
+    ap.add_argument("--concurrency", type=int, default=10,
+                    help="Maximum pushes in flight with --manifest (default: 10)")
+    ap.add_argument("--chunk-size", type=int, default=65536,
+                    help="Split transcript/SRT text into insertText requests of at most N characters, "
+                         "at line ends where possible (default: 65536; 0 disables chunking)")
     ap.add_argument("--oauth-client", help="Path to OAuth client JSON (optional)")
     ap.add_argument("--token", help="Path to token JSON (optional)")
     ap.add_argument("--verbose", action="store_true", help="Verbose logs to stderr")
@@ -56,7 +144,7 @@ def main() -> int:
         return 0
 
     # Strict validation (--help still shows signature even if args missing)
-    required = ["doc_id", "title", "txt"]
+    required = [] if args.manifest else ["doc_id", "title", "txt"]
     missing = [k for k in required if getattr(args, k) in (None, "")]
     if missing:
         eprint(f"ERROR: Missing required arguments: {', '.join(missing)}")
@@ -64,51 +152,45 @@ def main() -> int:
         return 2
 
     try:
-        if args.verbose:
+        jobs = load_manifest(args.manifest) if args.manifest else None
+
+        if jobs is not None:
+            if args.verbose:
+                eprint(f"[push] manifest={args.manifest} jobs={len(jobs)}")
+        elif args.verbose:
             eprint(f"[push] doc={args.doc_id}")
             eprint(f"[push] title={args.title}")
             eprint(f"[push] txt={args.txt}")
             if args.srt:
                 eprint(f"[push] srt={args.srt}")
 
-        # Authenticate
-        client = GoogleDocsClient()
-        if not client.authenticate(
-            oauth_client_path=args.oauth_client,
-            token_override=args.token,
-            verbose=args.verbose
-        ):
-            eprint("ERROR: Authentication failed")
-            return 1
+        # Read the transcript files while authentication (token refresh) is in flight
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            if jobs is None:
+                fut_txt = pool.submit(load_text, args.txt)
+                fut_srt = pool.submit(load_text, args.srt) if args.srt else None
+
+            # Authenticate
+            client = GoogleDocsClient()
+            if not client.authenticate(
+                oauth_client_path=args.oauth_client,
+                token_override=args.token,
+                verbose=args.verbose
+            ):
+                eprint("ERROR: Authentication failed")
+                return 1
 
-        # Insert heading
-        error = client.append_heading(args.doc_id, f"Transcript — {args.title}", level=2)
-        if error:
-            eprint(f"ERROR: Failed to append heading: {error}")
-            return 1
+            if jobs is None:
+                ops = build_ops(args.title, fut_txt.result(), fut_srt.result() if fut_srt else None)
 
-        # Insert transcript as fenced code block
-        txt_content = load_text(args.txt)
-        error = client.append_code_block(args.doc_id, "text", txt_content)
+        if jobs is not None:
+            return push_manifest(client, jobs, args.concurrency, args.chunk_size)
+
+        error = client.batch_append(args.doc_id, ops, chunk_size=args.chunk_size)
         if error:
             eprint(f"ERROR: Failed to append transcript: {error}")
             return 1
 
-        # Optional SRT
-        if args.srt:
-            # Add SRT subheading
-            error = client.append_heading(args.doc_id, "Subtitles (.srt)", level=3)
-            if error:
-                eprint(f"ERROR: Failed to append SRT subheading: {error}")
-                return 1
-
-            # Add SRT as fenced code block
-            srt_content = load_text(args.srt)
-            error = client.append_code_block(args.doc_id, "srt", srt_content)
-            if error:
-                eprint(f"ERROR: Failed to append SRT: {error}")
-                return 1
-
         # Success message to stdout
         print(f"Pushed transcript to document: {args.doc_id}")
         return 0
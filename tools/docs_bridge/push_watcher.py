@@ -0,0 +1,101 @@
+"""Cloud Pub/Sub push notifications for Google Doc changes."""
+
+from __future__ import annotations
+from typing import Callable, Optional
+
+
+class PushWatcher:
+    """
+    Wakes the bridge only when a change notification for the watched doc arrives.
+
+    The Drive `changes.watch` (or Workspace Events) channel for the doc must be
+    configured to publish to a Pub/Sub topic; this class consumes the matching
+    subscription with a streaming pull.
+    """
+
+    def __init__(self, subscription_path: str, doc_id: str, verbose: bool = False):
+        """
+        Initialize watcher.
+
+        Args:
+            subscription_path: Full subscription path (projects/<p>/subscriptions/<s>)
+            doc_id: Google Doc ID whose notifications trigger the callback
+            verbose: Enable verbose logging
+        """
+        self.subscription_path = subscription_path
+        self.doc_id = doc_id
+        self.verbose = verbose
+
+        self._on_doc_change: Optional[Callable[[], None]] = None
+        self._subscriber = None
+        self._future = None
+
+    def start(self, on_doc_change: Callable[[], None]) -> bool:
+        """
+        Start the streaming pull subscriber.
+
+        Args:
+            on_doc_change: Called (from a subscriber thread) for each doc notification
+
+        Returns:
+            True if the subscriber started, False otherwise
+        """
+        try:
+            from google.cloud import pubsub_v1
+        except ImportError as e:
+            print(f"Failed to import Pub/Sub client: {e}")
+            print("Install with: pip install google-cloud-pubsub")
+            return False
+
+        self._on_doc_change = on_doc_change
+
+        try:
+            self._subscriber = pubsub_v1.SubscriberClient()
+            # One message at a time so doc updates are never processed concurrently
+            flow_control = pubsub_v1.types.FlowControl(max_messages=1)
+            self._future = self._subscriber.subscribe(
+                self.subscription_path,
+                callback=self._on_change,
+                flow_control=flow_control
+            )
+        except Exception as e:
+            print(f"Failed to subscribe to {self.subscription_path}: {e}")
+            return False
+
+        if self.verbose:
+            print(f"[push] Subscribed to {self.subscription_path}")
+
+        return True
+
+    def stop(self):
+        """Cancel the streaming pull and close the subscriber."""
+        if self._future:
+            self._future.cancel()
+            try:
+                self._future.result(timeout=5)
+            except Exception:
+                pass
+            self._future = None
+
+        if self._subscriber:
+            self._subscriber.close()
+            self._subscriber = None
+
+    def _is_for_doc(self, message) -> bool:
+        """Check whether a notification refers to the watched doc."""
+        if any(self.doc_id in str(v) for v in message.attributes.values()):
+            return True
+        return self.doc_id.encode('utf-8') in message.data
+
+    def _on_change(self, message):
+        """Pub/Sub callback: run the doc check for matching notifications."""
+        try:
+            if self._is_for_doc(message):
+                if self.verbose:
+                    print(f"[push] Change notification: {message.message_id}")
+                self._on_doc_change()
+        except Exception as e:
+            print(f"Error handling change notification: {e}")
+        finally:
+            # Ack unconditionally; a redelivery would only repeat the same check
+            message.ack()
@@ -1,18 +1,33 @@
 #!/usr/bin/env python3
 """
-Transcribe audio files using OpenAI Whisper.
+Transcribe audio files using Whisper (faster-whisper or OpenAI Whisper backend).
 
 Outputs transcript as plain text (.txt) and subtitles (.srt).
 Writes JSON result to file for bulletproof parsing.
 """
 
 import argparse
+import hashlib
 import json
 import os
 import sys
 import shutil
+import signal
+import subprocess
 import time
 from pathlib import Path
+from typing import List, Optional
+
+try:
+    import orjson
+except ImportError:  # Optional; stdlib json is just slower on large segment lists
+    orjson = None
+
+# Segment count above which SRT timestamps are computed with numpy in one pass
+SRT_VECTORIZE_MIN = 1000
+
+# Size cap for the --resample-cache directory; least recently used WAVs go first
+RESAMPLE_CACHE_MAX_BYTES = 2 << 30
 
 
 def eprint(*args, **kwargs):
@@ -20,95 +35,617 @@ def eprint(*args, **kwargs):
     print(*args, file=sys.stderr, **kwargs)
 
 
+def _dumps(obj) -> str:
+    """Serialize obj to a JSON string, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj)
+
+
 def format_srt_timestamp(seconds: float) -> str:
     """Convert seconds to SRT timestamp format: HH:MM:SS,mmm"""
-    ms = int(round((seconds - int(seconds)) * 1000))
-    seconds = int(seconds)
-    s = seconds % 60
-    m = (seconds // 60) % 60
-    h = seconds // 3600
-    return f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
+    # Round once to whole milliseconds so e.g. 1.9996s carries into the seconds field
+    t = int(seconds * 1000 + 0.5)
+    t, ms = divmod(t, 1000)
+    t, s = divmod(t, 60)
+    h, m = divmod(t, 60)
+    return "%02d:%02d:%02d,%03d" % (h, m, s, ms)
+
+
+def format_srt_timestamps(seconds: List[float]) -> List[str]:
+    """format_srt_timestamp over many values, with the rounding and divmods done in numpy."""
+    import numpy as np
+
+    t = (np.asarray(seconds, dtype=np.float64) * 1000 + 0.5).astype(np.int64)
+    t, ms = np.divmod(t, 1000)
+    t, s = np.divmod(t, 60)
+    h, m = np.divmod(t, 60)
+    return ["%02d:%02d:%02d,%03d" % hmsm for hmsm in zip(h.tolist(), m.tolist(), s.tolist(), ms.tolist())]
+
+
+def load_model(backend: str, model_name: str, compile: bool = False, threads: int = 0):
+    """
+    Load a Whisper model for the given backend ("faster" or "openai").
+
+    Args:
+        compile: openai backend on CUDA only; torch.compile the encoder and warm it up
+        threads: CPU threads for inference (0 leaves the library default)
+    """
+    if backend == "faster":
+        import ctranslate2
+        from faster_whisper import WhisperModel
+
+        # int8 weights; fp16 activations on CUDA
+        cuda = ctranslate2.get_cuda_device_count() > 0
+        return WhisperModel(
+            model_name, device="auto", compute_type="int8_float16" if cuda else "int8", cpu_threads=threads
+        )
+
+    import torch
+    import whisper
+
+    if threads > 0:
+        torch.set_num_threads(threads)
+        torch.set_num_interop_threads(1)
+
+    model = whisper.load_model(model_name)
+
+    if compile:
+        if not torch.cuda.is_available():
+            eprint("WARNING: --compile needs CUDA; running uncompiled")
+            return model
+
+        # The encoder always sees one fixed-shape 30 s window; the decoder's growing
+        # token length would recompile on every step, so it stays eager
+        model.encoder = torch.compile(model.encoder, mode="reduce-overhead")
+        with torch.inference_mode():
+            model.encoder(torch.zeros(1, model.dims.n_mels, 3000, dtype=torch.float16, device=model.device))
+
+    return model
+
+
+def decode_audio(audio_path: Path, device):
+    """Decode audio to a 16 kHz mono float32 tensor in-process with torchaudio."""
+    import torchaudio
+
+    waveform, sample_rate = torchaudio.load(str(audio_path))
+    waveform = waveform.mean(dim=0).to(device)
+    if sample_rate != 16000:
+        waveform = torchaudio.functional.resample(waveform, sample_rate, 16000)
+    return waveform
+
+
+def resampled_audio(audio_path: Path, cache_dir: Path) -> Path:
+    """
+    Return a 16 kHz mono WAV copy of audio_path from cache_dir, converting with ffmpeg on a miss.
+
+    Entries are keyed by the SHA-1 of the first 1 MB plus the file size and mtime.
+    """
+    st = audio_path.stat()
+    digest = hashlib.sha1()
+    with open(audio_path, "rb") as f:
+        digest.update(f.read(1 << 20))
+    digest.update(f"{st.st_size}:{st.st_mtime_ns}".encode())
+    cache_path = cache_dir / f"{digest.hexdigest()}.wav"
+
+    if cache_path.exists():
+        os.utime(cache_path)  # Mark as recently used
+        return cache_path
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_dir / f"{cache_path.stem}.{os.getpid()}.tmp"
+    proc = subprocess.run(
+        ["ffmpeg", "-nostdin", "-loglevel", "error", "-i", str(audio_path),
+         "-ac", "1", "-ar", "16000", "-f", "wav", "-y", str(tmp_path)],
+        capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        tmp_path.unlink(missing_ok=True)
+        raise RuntimeError(f"ffmpeg resample failed: {proc.stderr.strip()}")
+    os.replace(tmp_path, cache_path)
+
+    # Evict least recently used entries beyond the size cap (never the one just made)
+    entries = sorted(cache_dir.glob("*.wav"), key=lambda p: p.stat().st_mtime)
+    total = sum(p.stat().st_size for p in entries)
+    for old in entries:
+        if total <= RESAMPLE_CACHE_MAX_BYTES:
+            break
+        if old != cache_path:
+            total -= old.stat().st_size
+            old.unlink(missing_ok=True)
+
+    return cache_path
+
+
+def run_model(
+    backend: str,
+    model,
+    audio_path: Path,
+    language: Optional[str] = None,
+    batch_size: int = 0,
+    decoded_audio: bool = False,
+    vad: bool = False
+) -> dict:
+    """
+    Transcribe one file.
+
+    Args:
+        batch_size: faster backend only; if > 0, decode speech chunks of the file
+                    in batches of this size via BatchedInferencePipeline
+        decoded_audio: openai backend only; decode in-process with torchaudio
+                       instead of whisper's ffmpeg subprocess
+        vad: faster backend only; skip non-speech with the bundled Silero VAD
+             (segment times stay on the original timeline; batched mode always uses it)
+
+    Returns:
+        OpenAI Whisper-shaped result; callers rely only on "segments": [{"start", "end", "text"}, ...]
+    """
+    if backend == "faster":
+        if batch_size > 0:
+            from faster_whisper import BatchedInferencePipeline
+            segments, _info = BatchedInferencePipeline(model=model).transcribe(
+                str(audio_path), language=language, beam_size=1, batch_size=batch_size
+            )
+        else:
+            # Greedy decoding, matching openai-whisper's transcribe() default
+            segments, _info = model.transcribe(
+                str(audio_path), language=language, beam_size=1, vad_filter=vad
+            )
+        return {"segments": [{"start": seg.start, "end": seg.end, "text": seg.text} for seg in segments]}
+
+    import torch
+
+    # Waveform on the model's device, so the log-mel STFT runs there too
+    audio = decode_audio(audio_path, model.device) if decoded_audio else str(audio_path)
+
+    # FP16 on CUDA (attention runs through scaled_dot_product_attention in openai-whisper >= 20240930)
+    with torch.inference_mode():
+        return model.transcribe(
+            audio, language=language, verbose=False, fp16=torch.cuda.is_available()
+        )
+
+
+def transcribe_one(
+    backend: str,
+    model,
+    audio_path: Path,
+    out_dir: Path,
+    json_out_path: Optional[Path],
+    language: Optional[str] = None,
+    quiet: bool = False,
+    resample_cache: bool = False,
+    emit_segments: bool = False,
+    **options
+) -> dict:
+    """
+    Transcribe one file with an already-loaded model and write its .txt, .srt and JSON result.
+
+    With resample_cache, the model reads a 16 kHz mono WAV kept under out_dir/.cache
+    (see resampled_audio). With emit_segments, the payload also carries
+    "segments": [{"start", "end", "text"}, ...]. Extra keyword options (see
+    model_options) are passed through to run_model.
+
+    Returns:
+        JSON payload (also written to json_out_path unless it is None)
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    stem = audio_path.stem
+    txt_path = out_dir / f"{stem}.txt"
+    srt_path = out_dir / f"{stem}.srt"
+
+    # Transcribe
+    if not quiet:
+        eprint(f"Transcribing: {audio_path.name}")
+    start_time = time.time()
+    source = resampled_audio(audio_path, out_dir / ".cache") if resample_cache else audio_path
+    result = run_model(backend, model, source, language, **options)
+    duration = time.time() - start_time
+
+    segments = result.get("segments", [])
+    if len(segments) > SRT_VECTORIZE_MIN:
+        # numpy is always present with either backend
+        stamps = format_srt_timestamps([t for seg in segments for t in (seg["start"], seg["end"])])
+        starts, ends = stamps[0::2], stamps[1::2]
+    else:
+        starts = [format_srt_timestamp(seg["start"]) for seg in segments]
+        ends = [format_srt_timestamp(seg["end"]) for seg in segments]
+
+    # Build plain text and SRT in one pass over the segments (bound appends, one per output)
+    text_parts = []
+    srt_parts = []
+    add_text = text_parts.append
+    add_srt = srt_parts.append
+    for i, (seg, start, end) in enumerate(zip(segments, starts, ends), 1):
+        seg_text = seg.get("text", "")
+        add_text(seg_text)
+        add_srt(f"{i}\n{start} --> {end}\n{seg_text.strip()}\n")
+
+    txt_path.write_text("".join(text_parts).strip(), encoding="utf-8")
+    srt_path.write_text("\n".join(srt_parts), encoding="utf-8")
+
+    # Write JSON result to file
+    payload = {
+        "txt": str(txt_path),
+        "srt": str(srt_path),
+        "duration_sec": round(duration, 2)
+    }
+    if emit_segments:
+        payload["segments"] = [
+            {"start": float(seg["start"]), "end": float(seg["end"]), "text": seg.get("text", "")}
+            for seg in segments
+        ]
+    if json_out_path is not None:
+        json_out_path.parent.mkdir(parents=True, exist_ok=True)
+        json_out_path.write_text(_dumps(payload), encoding="utf-8")
+
+    if not quiet:
+        eprint(f"Transcription complete in {duration:.1f}s")
+
+    return payload
+
+
+def write_json(path: str, payload) -> None:
+    """Write payload as JSON to path, or as one line on stdout when path is "-"."""
+    if path == "-":
+        sys.stdout.write(_dumps(payload) + "\n")
+        sys.stdout.flush()
+        return
+    json_out_path = Path(path).expanduser().resolve()
+    json_out_path.parent.mkdir(parents=True, exist_ok=True)
+    json_out_path.write_text(_dumps(payload), encoding="utf-8")
+
+
+def model_options(args) -> dict:
+    """Per-run options from the CLI for transcribe_one; all but resample_cache/emit_segments go on to run_model."""
+    return {
+        "resample_cache": args.resample_cache,
+        "emit_segments": args.emit_segments,
+        "batch_size": args.batch_size,
+        "decoded_audio": args.decoded_audio,
+        "vad": args.vad,
+    }
+
+
+# Per-run options that only one backend can apply
+OPTION_BACKENDS = {"batch_size": "faster", "vad": "faster", "decoded_audio": "openai"}
+
+
+def job_options(args, job: dict) -> dict:
+    """
+    Options for one server job: the server's model_options overridden by the job's "options".
+
+    Raises:
+        ValueError: for unknown options or ones this server's backend cannot apply
+    """
+    options = model_options(args)
+    overrides = job.get("options") or {}
+    unknown = sorted(set(overrides) - set(options))
+    if unknown:
+        raise ValueError(f"unknown options: {', '.join(unknown)}")
+    for key, value in overrides.items():
+        backend = OPTION_BACKENDS.get(key)
+        if value and backend and backend != args.backend:
+            raise ValueError(f"{key} requires a --backend {backend} server (this one runs {args.backend})")
+    options.update(overrides)
+    return options
+
+
+def _handle_sigterm(signum, frame):
+    """Unwind the server loop so the socket file is removed on shutdown."""
+    raise KeyboardInterrupt
+
+
+def handle_job(args, model, job: dict) -> dict:
+    """
+    Run one server job ({"audio", "out_dir"?, "json_out"?, "language"?, "options"?}); returns the response.
+
+    "options" overrides the server's per-run options (see model_options) for this job.
+    """
+    try:
+        options = job_options(args, job)
+    except ValueError as e:
+        return {"ok": False, "error": f"invalid job: {e}"}
+
+    try:
+        audio_path = Path(job["audio"]).expanduser().resolve()
+        if not audio_path.exists():
+            return {"ok": False, "error": f"Audio file not found: {audio_path}"}
+
+        payload = transcribe_one(
+            args.backend,
+            model,
+            audio_path,
+            Path(job.get("out_dir") or args.out_dir).expanduser().resolve(),
+            Path(job["json_out"]).expanduser().resolve() if job.get("json_out") else None,
+            job.get("language", args.language),
+            args.quiet,
+            **options
+        )
+        return {"ok": True, **payload}
+
+    except Exception as e:
+        return {"ok": False, "error": f"transcription failed: {e}"}
+
+
+def serve(args, model) -> int:
+    """
+    Keep the model loaded and run newline-delimited JSON jobs.
+
+    Jobs come from stdin (one response line per job on stdout), or from
+    connections on a Unix socket when --server-socket is given.
+    """
+    if not args.server_socket:
+        for line in sys.stdin:
+            if not line.strip():
+                continue
+            try:
+                response = handle_job(args, model, json.loads(line))
+            except ValueError as e:
+                response = {"ok": False, "error": f"invalid job: {e}"}
+            sys.stdout.write(_dumps(response) + "\n")
+            sys.stdout.flush()
+        return 0
+
+    import socketserver
+
+    class JobHandler(socketserver.StreamRequestHandler):
+        def handle(self):
+            for line in self.rfile:
+                if not line.strip():
+                    continue
+                try:
+                    response = handle_job(args, model, json.loads(line))
+                except ValueError as e:
+                    response = {"ok": False, "error": f"invalid job: {e}"}
+                self.wfile.write(_dumps(response).encode("utf-8") + b"\n")
+                self.wfile.flush()
+
+    # Replace a stale socket left by a previous server
+    if os.path.exists(args.server_socket):
+        os.unlink(args.server_socket)
+
+    signal.signal(signal.SIGTERM, _handle_sigterm)
+
+    # Single-threaded: jobs share one model and run one at a time
+    with socketserver.UnixStreamServer(args.server_socket, JobHandler) as server:
+        if not args.quiet:
+            eprint(f"Serving transcription jobs on {args.server_socket}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(args.server_socket)
+    return 0
+
+
+def run_client(args) -> int:
+    """Send one job to a --serve process on --server-socket and wait for its result."""
+    import socket
+
+    job = {
+        "audio": str(Path(args.audio).expanduser().resolve()),
+        "out_dir": str(Path(args.out_dir).expanduser().resolve()),
+        # With "-" the payload comes back in the response and is printed here instead
+        "json_out": None if args.json_out == "-" else str(Path(args.json_out).expanduser().resolve()),
+        "language": args.language,
+        # Per-run flags given on this command line (all default off) override the server's
+        "options": {key: value for key, value in model_options(args).items() if value},
+    }
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(args.server_socket)
+            sock.sendall(_dumps(job).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as f:
+                response = json.loads(f.readline())
+    except (OSError, ValueError) as e:
+        eprint(f"ERROR: transcription server at {args.server_socket} unavailable: {e}")
+        return 1
+
+    if not response.get("ok"):
+        eprint(f"ERROR: {response.get('error')}")
+        return 1
+
+    if args.json_out == "-":
+        write_json("-", {k: v for k, v in response.items() if k != "ok"})
+    if not args.quiet:
+        eprint(f"Transcription complete in {response['duration_sec']:.1f}s")
+    return 0
+
+
+def read_audio_list(list_path: str) -> List[Path]:
+    """
+    Read an --audio-list file (one audio path per line).
+
+    Raises:
+        ValueError: if two entries share a file stem, since their .txt/.srt
+                    outputs and JSON result keys would overwrite each other
+    """
+    with open(list_path, encoding="utf-8") as f:
+        audio_paths = [Path(line.strip()).expanduser().resolve() for line in f if line.strip()]
+
+    seen = {}
+    for audio_path in audio_paths:
+        other = seen.setdefault(audio_path.stem, audio_path)
+        if other is not audio_path:
+            raise ValueError(f"duplicate file stem '{audio_path.stem}': {other} and {audio_path}")
+    return audio_paths
+
+
+def transcribe_list(args, model, audio_paths: List[Path]) -> int:
+    """Transcribe every file in audio_paths with one model; --json-out gets {stem: payload}."""
+    out_dir = Path(args.out_dir).expanduser().resolve()
+    results = {}
+    failed = 0
+    for audio_path in audio_paths:
+        if not audio_path.exists():
+            eprint(f"ERROR: Audio file not found: {audio_path}")
+            results[audio_path.stem] = {"error": f"Audio file not found: {audio_path}"}
+            failed += 1
+            continue
+        try:
+            results[audio_path.stem] = transcribe_one(
+                args.backend, model, audio_path, out_dir, None, args.language, args.quiet, **model_options(args)
+            )
+        except Exception as e:
+            eprint(f"ERROR: transcription failed for {audio_path.name}: {e}")
+            results[audio_path.stem] = {"error": str(e)}
+            failed += 1
+
+    write_json(args.json_out, results)
+    return 1 if failed else 0
 
 
 def main():
     parser = argparse.ArgumentParser(description="Transcribe audio using Whisper")
-    parser.add_argument("--audio", required=True, help="Path to audio file")
+    parser.add_argument("--audio", help="Path to audio file (required unless --serve or --audio-list)")
+    parser.add_argument("--audio-list", help="File with one audio path per line, transcribed with one model load; "
+                                             "--json-out then maps each file stem to its result")
     parser.add_argument("--out-dir", default="out/transcripts", help="Output directory")
-    parser.add_argument("--model", default="small.en", help="Whisper model (tiny.en, base.en, small.en, etc.)")
+    parser.add_argument("--model", default="small.en",
+                        help="Whisper model (tiny.en, base.en, small.en, etc.). The faster backend also takes "
+                             "distilled models (distil-small.en, distil-medium.en, distil-large-v3), about 2x "
+                             "faster than their full-size counterparts; distil-small.en is recommended for English")
+    parser.add_argument("--backend", choices=["faster", "openai"], default="faster",
+                        help="Inference backend: faster-whisper (CTranslate2, default) or openai-whisper")
     parser.add_argument("--language", default=None, help="Language code (e.g., 'en')")
-    parser.add_argument("--json-out", required=True, help="Path to write JSON result")
+    parser.add_argument("--json-out", default="-",
+                        help="Path to write JSON result, or '-' for one line on stdout (default: -)")
+    parser.add_argument("--emit-segments", action="store_true",
+                        help='Include "segments": [{start, end, text}, ...] in the JSON result')
+    parser.add_argument("--batch-size", type=int, default=0,
+                        help="faster backend: decode each file's speech chunks in batches of N "
+                             "(BatchedInferencePipeline; default: 0, sequential)")
+    parser.add_argument("--vad", action="store_true",
+                        help="faster backend: skip silence with Silero VAD before decoding "
+                             "(always on with --batch-size)")
+    parser.add_argument("--decoded-audio", action="store_true",
+                        help="openai backend: decode audio in-process with torchaudio (no ffmpeg subprocess) "
+                             "and compute log-mel on the model device")
+    parser.add_argument("--resample-cache", action="store_true",
+                        help="Convert input to 16 kHz mono WAV once with ffmpeg and reuse it from "
+                             "<out-dir>/.cache on later runs")
+    parser.add_argument("--compile", action="store_true",
+                        help="openai backend on CUDA: torch.compile the encoder once at load "
+                             "(pays off for --serve and --audio-list runs)")
+    parser.add_argument("--threads", type=int, default=max(1, min(4, (os.cpu_count() or 2) // 2)),
+                        help="CPU inference threads (OMP/MKL and torch or CTranslate2); keep processes x "
+                             "threads at or below the physical core count (default: min(4, cores/2); "
+                             "0 = library default)")
+    parser.add_argument("--serve", action="store_true",
+                        help="Load the model once and run JSON-lines jobs from stdin (or --server-socket)")
+    parser.add_argument("--server-socket", help="Unix socket: served on with --serve, otherwise the job "
+                                                "is sent to the server listening there")
     parser.add_argument("--quiet", action="store_true", help="Suppress stderr output except fatal errors")
     args = parser.parse_args()
 
-    # Check ffmpeg availability
-    if shutil.which("ffmpeg") is None:
+    if args.model.startswith("distil-") and args.backend != "faster":
+        parser.error(f"--model {args.model} requires --backend faster (openai-whisper has no distilled models)")
+    if args.batch_size > 0 and args.backend != "faster":
+        parser.error("--batch-size requires --backend faster")
+    if args.vad and args.backend != "faster":
+        parser.error("--vad requires --backend faster")
+    if args.compile and args.backend != "openai":
+        parser.error("--compile requires --backend openai")
+    if args.decoded_audio and args.backend != "openai":
+        parser.error("--decoded-audio requires --backend openai (faster-whisper already decodes in-process)")
+
+    if not args.serve:
+        if args.audio and args.audio_list:
+            parser.error("--audio and --audio-list are mutually exclusive")
+        if args.audio_list and args.server_socket:
+            parser.error("--audio-list cannot be sent to a --server-socket")
+
+        if not (args.audio or args.audio_list):
+            parser.error("the following arguments are required: --audio")
+
+        # Thin client: the server process holds the model
+        if args.server_socket:
+            return run_client(args)
+
+    # Check ffmpeg availability (faster-whisper decodes in-process via PyAV)
+    needs_ffmpeg = args.resample_cache or (args.backend == "openai" and not args.decoded_audio)
+    if needs_ffmpeg and shutil.which("ffmpeg") is None:
         eprint("ERROR: ffmpeg not found on PATH. Install with: brew install ffmpeg")
         return 2
 
+    # Check inputs before the backend import below, which pulls in torch/CTranslate2 and takes seconds
+    if not args.serve:
+        if args.audio_list:
+            try:
+                audio_paths = read_audio_list(args.audio_list)
+            except OSError as e:
+                eprint(f"ERROR: Audio list not readable: {e}")
+                return 1
+            except ValueError as e:
+                eprint(f"ERROR: --audio-list has a {e}")
+                return 1
+        else:
+            audio_path = Path(args.audio).expanduser().resolve()
+            if not audio_path.exists():
+                eprint(f"ERROR: Audio file not found: {audio_path}")
+                return 1
+
     # Reduce noise from tokenizers
     os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
 
-    # Import whisper
+    # Thread pools size themselves from these when the backend is first imported
+    if args.threads > 0:
+        os.environ["OMP_NUM_THREADS"] = str(args.threads)
+        os.environ["MKL_NUM_THREADS"] = str(args.threads)
+
+    # Import backend
     try:
-        import whisper
+        if args.backend == "faster":
+            import faster_whisper  # noqa: F401
+        else:
+            import whisper  # noqa: F401
     except ImportError as e:
-        eprint(f"ERROR: failed to import whisper: {e}")
-        eprint("Install with: pip install openai-whisper")
+        eprint(f"ERROR: failed to import {args.backend} whisper backend: {e}")
+        eprint("Install with: pip install " + ("faster-whisper" if args.backend == "faster" else "openai-whisper"))
         return 3
 
-    # Resolve paths
-    audio_path = Path(args.audio).expanduser().resolve()
-    if not audio_path.exists():
-        eprint(f"ERROR: Audio file not found: {audio_path}")
-        return 1
-
-    out_dir = Path(args.out_dir).expanduser().resolve()
-    out_dir.mkdir(parents=True, exist_ok=True)
-
-    json_out_path = Path(args.json_out).expanduser().resolve()
-    json_out_path.parent.mkdir(parents=True, exist_ok=True)
-
-    stem = audio_path.stem
-    txt_path = out_dir / f"{stem}.txt"
-    srt_path = out_dir / f"{stem}.srt"
+    if args.decoded_audio:
+        try:
+            import torchaudio  # noqa: F401
+        except ImportError as e:
+            eprint(f"ERROR: failed to import torchaudio: {e}")
+            eprint("Install with: pip install torchaudio")
+            return 3
 
-    try:
-        # Load model
+    if args.serve:
         if not args.quiet:
-            eprint(f"Loading Whisper model: {args.model}")
-        model = whisper.load_model(args.model)
+            eprint(f"Loading Whisper model: {args.model} (backend: {args.backend})")
+        return serve(args, load_model(args.backend, args.model, args.compile, args.threads))
 
-        # Transcribe
+    if args.audio_list:
         if not args.quiet:
-            eprint(f"Transcribing: {audio_path.name}")
-        start_time = time.time()
-        result = model.transcribe(str(audio_path), language=args.language, verbose=False)
-        duration = time.time() - start_time
-
-        # Write plain text
-        text = result.get("text", "").strip()
-        txt_path.write_text(text, encoding="utf-8")
-
-        # Write SRT
-        srt_lines = []
-        for i, seg in enumerate(result.get("segments", []), 1):
-            srt_lines.append(str(i))
-            srt_lines.append(f"{format_srt_timestamp(seg['start'])} --> {format_srt_timestamp(seg['end'])}")
-            srt_lines.append(seg.get("text", "").strip())
-            srt_lines.append("")
-        srt_path.write_text("\n".join(srt_lines), encoding="utf-8")
-
-        # Write JSON result to file
-        payload = {
-            "txt": str(txt_path),
-            "srt": str(srt_path),
-            "duration_sec": round(duration, 2)
-        }
-        json_out_path.write_text(json.dumps(payload), encoding="utf-8")
+            eprint(f"Loading Whisper model: {args.model} (backend: {args.backend})")
+        try:
+            return transcribe_list(args, load_model(args.backend, args.model, args.compile, args.threads), audio_paths)
+        except Exception as e:
+            eprint(f"ERROR: transcription failed: {e}")
+            return 1
 
+    try:
+        # Load model
         if not args.quiet:
-            eprint(f"Transcription complete in {duration:.1f}s")
+            eprint(f"Loading Whisper model: {args.model} (backend: {args.backend})")
+        model = load_model(args.backend, args.model, args.compile, args.threads)
 
+        payload = transcribe_one(
+            args.backend,
+            model,
+            audio_path,
+            Path(args.out_dir).expanduser().resolve(),
+            None,
+            args.language,
+            args.quiet,
+            **model_options(args)
+        )
+        write_json(args.json_out, payload)
         return 0
 
     except Exception as e:
@@ -0,0 +1,142 @@
+"""Work-stealing thread pool for background render jobs."""
+
+from __future__ import annotations
+import heapq
+import itertools
+import random
+import threading
+from typing import Any, Callable, List, Optional
+
+
+class WorkerPool:
+    """
+    Thread pool where each worker owns a priority heap.
+
+    Workers pop the most urgent item (lowest priority value, then oldest) from
+    their own heap and, when it is empty, steal the most urgent item from a
+    random peer. Idle workers block on a condition variable instead of spinning.
+    """
+
+    def __init__(self, handler: Callable[[Any], None], num_workers: int = 1):
+        """
+        Initialize pool.
+
+        Args:
+            handler: Called with each submitted item on a worker thread
+            num_workers: Number of worker threads (default: 1)
+        """
+        self.num_workers = max(1, num_workers)
+        self._handler = handler
+
+        # Entries are (priority, seq, item); seq keeps FIFO order within a priority
+        self._heaps: List[list] = [[] for _ in range(self.num_workers)]
+        self._locks = [threading.Lock() for _ in range(self.num_workers)]
+        self._next_worker = 0
+        self._seq = itertools.count()
+
+        # Guards _pending and _running; idle workers wait on it
+        self._cond = threading.Condition()
+        self._pending = 0
+        self._running = False
+        self._threads: List[threading.Thread] = []
+
+    def start(self):
+        """Start worker threads."""
+        with self._cond:
+            self._running = True
+
+        for i in range(self.num_workers):
+            thread = threading.Thread(target=self._worker_loop, args=(i,), daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: float = 5):
+        """Stop worker threads, waiting up to `timeout` seconds for each."""
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+
+        for thread in self._threads:
+            thread.join(timeout=timeout)
+        self._threads = []
+
+    def submit(self, item: Any, priority: int = 0):
+        """Queue an item on the next worker's heap (round-robin)."""
+        with self._cond:
+            index = self._next_worker
+            self._next_worker = (index + 1) % self.num_workers
+            self._pending += 1
+
+        with self._locks[index]:
+            heapq.heappush(self._heaps[index], (priority, next(self._seq), item))
+
+        with self._cond:
+            self._cond.notify()
+
+    def remove_if(self, predicate: Callable[[Any], bool]) -> List[Any]:
+        """
+        Remove all queued items matching `predicate`.
+
+        Items already handed to a worker are not affected.
+
+        Returns:
+            Removed items
+        """
+        removed = []
+        for index in range(self.num_workers):
+            with self._locks[index]:
+                heap = self._heaps[index]
+                keep = [entry for entry in heap if not predicate(entry[2])]
+                if len(keep) != len(heap):
+                    removed.extend(entry[2] for entry in heap if predicate(entry[2]))
+                    heapq.heapify(keep)
+                    self._heaps[index] = keep
+
+        if removed:
+            with self._cond:
+                self._pending -= len(removed)
+
+        return removed
+
+    def _pop_own(self, index: int) -> Optional[Any]:
+        """Pop the most urgent item from this worker's heap."""
+        with self._locks[index]:
+            if self._heaps[index]:
+                return heapq.heappop(self._heaps[index])[2]
+        return None
+
+    def _steal(self, index: int) -> Optional[Any]:
+        """Pop the most urgent item from another worker's heap, starting at a random peer."""
+        offset = random.randrange(self.num_workers)
+        for k in range(self.num_workers):
+            victim = (offset + k) % self.num_workers
+            if victim == index:
+                continue
+            with self._locks[victim]:
+                if self._heaps[victim]:
+                    return heapq.heappop(self._heaps[victim])[2]
+        return None
+
+    def _worker_loop(self, index: int):
+        """Worker loop: own heap first, then steal, then sleep."""
+        while True:
+            with self._cond:
+                while self._running and self._pending == 0:
+                    self._cond.wait()
+                if not self._running:
+                    return
+
+            item = self._pop_own(index)
+            if item is None:
+                item = self._steal(index)
+            if item is None:
+                # Submitter counted the item but has not pushed it yet
+                continue
+
+            with self._cond:
+                self._pending -= 1
+
+            try:
+                self._handler(item)
+            except Exception as e:
+                print(f"Error in worker {index}: {e}")